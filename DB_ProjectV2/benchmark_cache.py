@@ -0,0 +1,75 @@
+"""Reference cache round-trip benchmark.
+
+Requests pages that read the cached reference tables (foods, enclosures, animal compatibility) in a fresh
+process with the cache on, and again with it off (ZOO_CACHE_TTL=0 expires every entry at once). Reports
+database round trips per request, from X-Query-Count, and latency. Needs the database from
+ZOO_DATABASE_URL.
+
+    python benchmark_cache.py --requests 200 --path /foods --path /enclosures
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PATHS = ("/foods", "/enclosures", "/animal-compatibilities", "/enclosures/1/placement-check?species=Lion")
+MODES = {"off": {"ZOO_CACHE_TTL": "0"}, "on": {}}
+
+
+def child(paths, requests):
+    from fastapi.testclient import TestClient
+
+    import main
+
+    results = {}
+    with TestClient(main.create_app()) as client:
+        for path in paths:
+            queries, latencies, statuses = [], [], set()
+            for _ in range(requests):
+                started = time.perf_counter()
+                response = client.get(path)
+                latencies.append(time.perf_counter() - started)
+                queries.append(int(response.headers["X-Query-Count"]))
+                statuses.add(response.status_code)
+            results[path] = {"statuses": sorted(statuses), "queries": statistics.mean(queries), "latency": statistics.median(latencies)}
+    print(json.dumps(results))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--path", action="append", help="repeat for several pages (default: the reference pages)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    paths = args.path or list(PATHS)
+
+    if args.child:
+        return child(paths, args.requests)
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    results = {}
+    for mode, env in MODES.items():
+        command = [sys.executable, os.path.abspath(__file__), "--child", "--requests", str(args.requests)]
+        for path in paths:
+            command += ["--path", path]
+        output = subprocess.run(
+            command, cwd=here, capture_output=True, text=True, check=True, env={**os.environ, **env},
+        ).stdout
+        results[mode] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"{args.requests} requests per page; queries per request and median latency (ms)")
+    print(f"{'path':<45}{'status':>8}{'q off':>8}{'q on':>8}{'ms off':>9}{'ms on':>9}")
+    for path in paths:
+        off, on = results["off"][path], results["on"][path]
+        status = ",".join(map(str, on["statuses"]))
+        print(
+            f"{path:<45}{status:>8}{off['queries']:>8.2f}{on['queries']:>8.2f}"
+            f"{off['latency'] * 1000:>9.2f}{on['latency'] * 1000:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Sync vs async load benchmark.
+
+Serves the app in a fresh process per mode (ZOO_ASYNC_DB=0 and ZOO_ASYNC_DB=1) and drives one page with
+N concurrent clients through the ASGI interface, so the numbers show the handler, pool and database cost
+without a network or HTTP server in between. Needs the database from ZOO_DATABASE_URL.
+
+    python benchmark_load.py --clients 50 200 1000 --requests 5 --path /animals
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+from benchmark_startup import asgi_get
+
+MODES = {"sync": "0", "async": "1"}
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def child(path, clients, requests):
+    import main
+    app = main.create_app()
+
+    async def client(latencies, statuses):
+        for _ in range(requests):
+            started = time.perf_counter()
+            statuses.append(await asgi_get(app, path))
+            latencies.append(time.perf_counter() - started)
+
+    async def serve():
+        results = []
+        async with app.router.lifespan_context(app):
+            for count in clients:
+                latencies, statuses = [], []
+                started = time.perf_counter()
+                await asyncio.gather(*(client(latencies, statuses) for _ in range(count)))
+                elapsed = time.perf_counter() - started
+                results.append({
+                    "clients": count, "requests": len(latencies), "errors": sum(status != 200 for status in statuses),
+                    "rps": len(latencies) / elapsed, "p50": percentile(latencies, 0.5),
+                    "p95": percentile(latencies, 0.95), "p99": percentile(latencies, 0.99),
+                })
+        return results
+
+    print(json.dumps(asyncio.run(serve())))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument("--requests", type=int, default=5, help="requests per client")
+    parser.add_argument("--path", default="/animals")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return child(args.path, args.clients, args.requests)
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    print(f"{args.path}: {args.requests} requests per client (latency in ms)")
+    print(f"{'mode':<8}{'clients':>8}{'req/s':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'errors':>8}")
+    for mode, flag in MODES.items():
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", "--path", args.path,
+             "--requests", str(args.requests), "--clients", *map(str, args.clients)],
+            cwd=here, capture_output=True, text=True, check=True, env={**os.environ, "ZOO_ASYNC_DB": flag},
+        ).stdout
+        for result in json.loads(output.strip().splitlines()[-1]):
+            print(
+                f"{mode:<8}{result['clients']:>8}{result['rps']:>10.1f}{result['p50'] * 1000:>10.1f}"
+                f"{result['p95'] * 1000:>10.1f}{result['p99'] * 1000:>10.1f}{result['errors']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""/search latency benchmark.
+
+Sends each query to /search through the app, after one untimed warm-up request, and reports the latency
+spread, the number of results and the top hit. The queries cover the prefix-only path (under three
+characters), word prefixes, substrings and misspellings. Needs the database from ZOO_DATABASE_URL,
+filled to the size being measured.
+
+    python benchmark_search.py --runs 50 --query lion --query gorila
+"""
+import argparse
+import statistics
+import time
+
+QUERIES = ("ka", "lion", "gorila", "panthera leo", "kari", "ben lo", "xqzw", "ilnaus")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--query", action="append", help="repeat for several queries (default: a mixed set)")
+    args = parser.parse_args()
+
+    from fastapi.testclient import TestClient
+
+    import main as zoo
+
+    print(f"{args.runs} runs per query, limit {args.limit} (ms)")
+    print(f"{'query':<16}{'min':>8}{'median':>8}{'p95':>8}{'max':>8}{'hits':>6}  top")
+    with TestClient(zoo.create_app()) as client:
+        for q in args.query or QUERIES:
+            params = {"q": q, "limit": args.limit}
+            results = client.get("/search", params=params).json()["results"]
+            latencies = []
+            for _ in range(args.runs):
+                started = time.perf_counter()
+                client.get("/search", params=params).raise_for_status()
+                latencies.append((time.perf_counter() - started) * 1000)
+            latencies.sort()
+            top = f"{results[0]['kind']} {results[0]['title']}" if results else "-"
+            print(
+                f"{q:<16}{latencies[0]:>8.1f}{statistics.median(latencies):>8.1f}"
+                f"{latencies[int(len(latencies) * 0.95) - 1]:>8.1f}{latencies[-1]:>8.1f}{len(results):>6}  {top}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Time-to-first-request benchmark.
+
+Starts the app in fresh processes, as a worker does, and times each phase: importing main, the lifespan
+warm-up and the first request to a page. Needs the database from ZOO_DATABASE_URL.
+
+    python benchmark_startup.py --runs 5 --path /animals
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PHASES = ("import", "warmup", "first_request", "total")
+
+
+async def asgi_get(app, path):
+    """Send one GET through the ASGI app and return the response status."""
+    statuses = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        # One empty body, then block like a server whose client stays connected
+        if requests:
+            return requests.pop()
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"", "headers": [],
+        "client": ("127.0.0.1", 0), "server": ("127.0.0.1", 8000),
+    }
+    await app(scope, receive, send)
+    return statuses[0]
+
+
+def child(path):
+    started = time.perf_counter()
+    import main
+    imported = time.perf_counter()
+    app = main.create_app()
+
+    async def serve():
+        async with app.router.lifespan_context(app):
+            ready = time.perf_counter()
+            status = await asgi_get(app, path)
+            return ready, status
+
+    ready, status = asyncio.run(serve())
+    done = time.perf_counter()
+    print(json.dumps({
+        "status": status, "import": imported - started, "warmup": ready - imported,
+        "first_request": done - ready, "total": done - started,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--path", default="/animals")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return child(args.path)
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    results = []
+    for _ in range(args.runs):
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", "--path", args.path],
+            cwd=here, capture_output=True, text=True, check=True,
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(f"{args.path}: status {results[-1]['status']}, {args.runs} runs (ms)")
+    print(f"{'phase':<15}{'min':>10}{'median':>10}{'max':>10}")
+    for phase in PHASES:
+        values = [result[phase] * 1000 for result in results]
+        print(f"{phase:<15}{min(values):>10.1f}{statistics.median(values):>10.1f}{max(values):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
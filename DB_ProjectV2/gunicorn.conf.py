@@ -0,0 +1,18 @@
+# Multi-process deployment: gunicorn -c gunicorn.conf.py (run from DB_ProjectV2, needs gunicorn and uvicorn)
+# Settings come from the same ZOO_* environment variables as the app, plus ZOO_BIND and ZOO_WORKERS.
+import multiprocessing
+import os
+
+bind = os.environ.get("ZOO_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("ZOO_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+wsgi_app = "main:create_app()"
+
+# Each worker imports main itself: engines and pools opened in the master before the fork would be shared
+# by every worker. Every worker keeps up to ZOO_POOL_SIZE + ZOO_MAX_OVERFLOW connections, so
+# workers * (pool_size + max_overflow) has to stay under the server's max_connections.
+preload_app = False
+
+# The lifespan warm-up runs before a worker accepts connections; it must finish within the timeout
+timeout = 60
+graceful_timeout = 30
@@ -0,0 +1,389 @@
+"""Baseline schema
+
+Everything the hand-run SQL_REQUESTS scripts used to build: DB_Create.sql, CreateTriggers.sql,
+CreateStatementTriggers.sql, CreateIndexes.sql, AnimalLatestVitals.sql and FeedingSchedule.sql.
+A database that was already built from those scripts is adopted with `alembic stamp 0001`
+followed by `alembic upgrade head`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = """
+CREATE TABLE employee (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(50) NOT NULL,
+    position VARCHAR(50),
+    sex CHAR(1),
+    age INT,
+    start_date DATE,
+    has_access_to_enclosures BOOLEAN,
+    salary DECIMAL(10, 2),
+    CONSTRAINT position_check CHECK (position IN ('Veterinarian', 'Cleaner', 'Trainer', 'Builder', 'Administrator'))
+);
+
+CREATE TABLE employeeAttributes (
+    id SERIAL PRIMARY KEY,
+    employee_id INT REFERENCES employee(id),
+    attribute_name VARCHAR(50),
+    attribute_value VARCHAR(100)
+);
+
+CREATE TABLE enclosure (
+    id SERIAL PRIMARY KEY,
+    size INT,
+    is_heated BOOLEAN
+);
+
+CREATE TABLE enclosureAccess (
+    enclosure_id INT REFERENCES enclosure(id),
+    employee_id INT REFERENCES employee(id),
+    PRIMARY KEY (enclosure_id, employee_id)
+);
+
+CREATE TABLE foods (
+    id SERIAL PRIMARY KEY,
+    type VARCHAR(50),
+    name VARCHAR(50),
+    CONSTRAINT type_check CHECK (type IN ('Vegetable', 'Live', 'Meat', 'Mixed'))
+);
+
+CREATE TABLE supplies (
+    id SERIAL PRIMARY KEY,
+    food_id INT REFERENCES foods(id),
+    supplier_name VARCHAR(50)
+);
+
+CREATE TABLE animal (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(50),
+    species VARCHAR(50),
+    needs_heated_enclosure_for_winter BOOLEAN,
+    predator_or_herbivore CHAR(1),
+    gender CHAR(1),
+    date_of_birth DATE,
+    arrival_date DATE,
+    father_id INT REFERENCES animal(id),
+    mother_id INT REFERENCES animal(id),
+    enclosure_id INT REFERENCES enclosure(id),
+    CONSTRAINT predator_or_herbivore_check CHECK (predator_or_herbivore IN ('P', 'H'))
+);
+
+CREATE TABLE vetCard (
+    id SERIAL PRIMARY KEY,
+    employee_id INT REFERENCES employee(id),
+    animal_id INT REFERENCES animal(id),
+    current_diseases VARCHAR(100),
+    got_vaccination VARCHAR(100),
+    date DATE,
+    weight DECIMAL(5, 2),
+    height DECIMAL(5, 2)
+);
+
+CREATE TABLE ration (
+    id SERIAL PRIMARY KEY,
+    day_of_the_week VARCHAR(10),
+    time TIME,
+    food_id INT REFERENCES foods(id),
+    animal_id INT REFERENCES animal(id)
+);
+
+CREATE TABLE animalCompatibility (
+    id SERIAL PRIMARY KEY,
+    first_species VARCHAR(50),
+    second_species VARCHAR(50),
+    is_compatible BOOLEAN
+);
+
+CREATE TABLE users (
+    id SERIAL PRIMARY KEY,
+    username VARCHAR(50) UNIQUE NOT NULL,
+    email VARCHAR(100) UNIQUE NOT NULL,
+    hashed_password VARCHAR(255) NOT NULL,
+    is_active BOOLEAN DEFAULT TRUE,
+    is_admin BOOLEAN DEFAULT FALSE
+);
+
+CREATE TABLE animal_latest_vitals (
+    animal_id INT PRIMARY KEY REFERENCES animal(id) ON DELETE CASCADE,
+    vetcard_id INT NOT NULL REFERENCES vetCard(id) ON DELETE CASCADE,
+    date DATE,
+    weight DECIMAL(5, 2),
+    height DECIMAL(5, 2)
+);
+"""
+
+# Row-level functions are kept alongside the statement-level ones, SQL_REQUESTS/BenchmarkTriggers.sql uses both
+TRIGGERS = """
+CREATE FUNCTION check_herbivore_diet()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF (NEW.animal_id IS NOT NULL) THEN
+        DECLARE
+            food_type VARCHAR(50);
+            diet_type CHAR(1);
+        BEGIN
+            SELECT type INTO food_type FROM foods WHERE id = NEW.food_id;
+            SELECT predator_or_herbivore INTO diet_type FROM animal WHERE id = NEW.animal_id;
+
+            IF diet_type = 'H' AND food_type != 'Vegetable' THEN
+                RAISE EXCEPTION 'Herbivores can only eat vegetable food';
+            END IF;
+        END;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION check_employee_access()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF (NEW.employee_id IS NOT NULL) THEN
+        DECLARE
+            has_access BOOLEAN;
+        BEGIN
+            SELECT has_access_to_enclosures INTO has_access FROM employee WHERE id = NEW.employee_id;
+
+            IF has_access = FALSE THEN
+                RAISE EXCEPTION 'Employee does not have access to enclosures';
+            END IF;
+        END;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION is_veterinarian(employee_id INT) RETURNS BOOLEAN AS $$
+DECLARE
+    pos VARCHAR(50);
+BEGIN
+    SELECT position INTO pos FROM employee WHERE id = employee_id;
+    RETURN pos = 'Veterinarian';
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION check_veterinarian_permission() RETURNS TRIGGER AS $$
+BEGIN
+    IF NOT is_veterinarian(NEW.employee_id) THEN
+        RAISE EXCEPTION 'Only veterinarians can add information to vetCard table';
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION set_access_to_enclosures()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF (NEW.position IS NOT NULL) THEN
+        IF NEW.position IN ('Veterinarian', 'Trainer', 'Cleaner') THEN
+            NEW.has_access_to_enclosures := TRUE;
+        ELSE
+            NEW.has_access_to_enclosures := FALSE;
+        END IF;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_set_access_to_enclosures
+BEFORE INSERT OR UPDATE ON employee
+FOR EACH ROW EXECUTE FUNCTION set_access_to_enclosures();
+
+CREATE FUNCTION check_herbivore_diet_batch()
+RETURNS TRIGGER AS $$
+DECLARE
+    bad_id INT;
+BEGIN
+    SELECT n.id INTO bad_id
+    FROM new_rows n
+    JOIN animal a ON a.id = n.animal_id
+    JOIN foods f ON f.id = n.food_id
+    WHERE a.predator_or_herbivore = 'H' AND f.type != 'Vegetable'
+    LIMIT 1;
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'Herbivores can only eat vegetable food'
+            USING DETAIL = format('ration id %s', bad_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_check_herbivore_diet_insert
+AFTER INSERT ON ration
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION check_herbivore_diet_batch();
+
+CREATE TRIGGER trg_check_herbivore_diet_update
+AFTER UPDATE ON ration
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION check_herbivore_diet_batch();
+
+CREATE FUNCTION check_employee_access_batch()
+RETURNS TRIGGER AS $$
+DECLARE
+    bad_id INT;
+BEGIN
+    SELECT n.employee_id INTO bad_id
+    FROM new_rows n
+    JOIN employee e ON e.id = n.employee_id
+    WHERE e.has_access_to_enclosures = FALSE
+    LIMIT 1;
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'Employee does not have access to enclosures'
+            USING DETAIL = format('employee id %s', bad_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_check_employee_access_insert
+AFTER INSERT ON enclosureAccess
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION check_employee_access_batch();
+
+CREATE TRIGGER trg_check_employee_access_update
+AFTER UPDATE ON enclosureAccess
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION check_employee_access_batch();
+
+CREATE FUNCTION check_veterinarian_permission_batch()
+RETURNS TRIGGER AS $$
+DECLARE
+    bad_id INT;
+BEGIN
+    SELECT n.id INTO bad_id
+    FROM new_rows n
+    JOIN employee e ON e.id = n.employee_id
+    WHERE e.position != 'Veterinarian'
+    LIMIT 1;
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'Only veterinarians can add information to vetCard table'
+            USING DETAIL = format('vetCard id %s', bad_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER vetcard_permission_insert
+AFTER INSERT ON vetCard
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION check_veterinarian_permission_batch();
+
+CREATE TRIGGER vetcard_permission_update
+AFTER UPDATE ON vetCard
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION check_veterinarian_permission_batch();
+
+CREATE FUNCTION refresh_animal_latest_vitals(p_animal_id INT)
+RETURNS VOID AS $$
+BEGIN
+    DELETE FROM animal_latest_vitals WHERE animal_id = p_animal_id;
+
+    INSERT INTO animal_latest_vitals (animal_id, vetcard_id, date, weight, height)
+    SELECT animal_id, id, date, weight, height
+    FROM vetCard
+    WHERE animal_id = p_animal_id
+    ORDER BY date DESC NULLS LAST, id DESC
+    LIMIT 1;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION sync_animal_latest_vitals()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF (TG_OP IN ('INSERT', 'UPDATE') AND NEW.animal_id IS NOT NULL) THEN
+        PERFORM refresh_animal_latest_vitals(NEW.animal_id);
+    END IF;
+    IF (TG_OP IN ('UPDATE', 'DELETE') AND OLD.animal_id IS NOT NULL
+        AND (TG_OP = 'DELETE' OR OLD.animal_id IS DISTINCT FROM NEW.animal_id)) THEN
+        PERFORM refresh_animal_latest_vitals(OLD.animal_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_sync_animal_latest_vitals
+AFTER INSERT OR UPDATE OR DELETE ON vetCard
+FOR EACH ROW EXECUTE FUNCTION sync_animal_latest_vitals();
+"""
+
+INDEXES = """
+CREATE INDEX idx_employee_position_sex_age ON employee (position, sex, age);
+CREATE INDEX idx_employee_salary ON employee (salary);
+CREATE INDEX idx_vetcard_animal_date_employee ON vetCard (animal_id, date, employee_id);
+CREATE INDEX idx_vetcard_date_employee ON vetCard (date, employee_id);
+CREATE INDEX idx_vetcard_animal_date_id ON vetCard (animal_id, date DESC, id DESC);
+CREATE INDEX idx_animal_winter_species_dob ON animal (species, date_of_birth)
+WHERE needs_heated_enclosure_for_winter;
+CREATE UNIQUE INDEX uq_animalcompatibility_pair ON animalCompatibility (
+    LEAST(lower(trim(first_species)), lower(trim(second_species))),
+    GREATEST(lower(trim(first_species)), lower(trim(second_species)))
+);
+CREATE INDEX idx_animal_father_id ON animal (father_id);
+CREATE INDEX idx_animal_mother_id ON animal (mother_id);
+CREATE INDEX idx_ration_day_time ON ration (day_of_the_week, time);
+"""
+
+FEEDING_SCHEDULE = """
+CREATE MATERIALIZED VIEW feeding_schedule AS
+SELECT r.day_of_the_week,
+       r.time,
+       r.food_id,
+       f.name AS food_name,
+       f.type AS food_type,
+       count(*) AS portions
+FROM ration r
+JOIN foods f ON f.id = r.food_id
+GROUP BY r.day_of_the_week, r.time, r.food_id, f.name, f.type;
+
+CREATE UNIQUE INDEX uq_feeding_schedule_slot_food ON feeding_schedule (day_of_the_week, time, food_id);
+CREATE INDEX idx_feeding_schedule_food ON feeding_schedule (food_id);
+
+CREATE FUNCTION refresh_feeding_schedule()
+RETURNS VOID AS $$
+BEGIN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY feeding_schedule;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(TABLES)
+    op.execute(TRIGGERS)
+    op.execute(INDEXES)
+    op.execute(FEEDING_SCHEDULE)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP FUNCTION refresh_feeding_schedule()")
+    op.execute("DROP MATERIALIZED VIEW feeding_schedule")
+    op.execute(
+        "DROP TABLE animal_latest_vitals, users, animalCompatibility, ration, vetCard, animal, "
+        "supplies, foods, enclosureAccess, enclosure, employeeAttributes, employee"
+    )
+    op.execute(
+        "DROP FUNCTION sync_animal_latest_vitals(), refresh_animal_latest_vitals(INT), "
+        "check_veterinarian_permission_batch(), check_employee_access_batch(), check_herbivore_diet_batch(), "
+        "set_access_to_enclosures(), check_veterinarian_permission(), is_veterinarian(INT), "
+        "check_employee_access(), check_herbivore_diet()"
+    )
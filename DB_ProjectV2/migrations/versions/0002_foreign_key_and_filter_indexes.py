@@ -0,0 +1,53 @@
+"""Foreign key and filter indexes
+
+PostgreSQL does not index the referencing side of a foreign key. Without these indexes the
+list pages' joinedload lookups, the task3/task4 joins and every parent delete (which has to
+look for referencing rows) fall back to sequential scans. vetcard.animal_id is already the
+leading column of idx_vetcard_animal_date_employee, so it gets no index of its own.
+
+The indexes are built CONCURRENTLY so that running the migration does not block writes.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 12:30:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = {
+    # Foreign keys
+    "idx_vetcard_employee_id": "vetCard (employee_id)",
+    "idx_ration_animal_id": "ration (animal_id)",
+    "idx_ration_food_id": "ration (food_id)",
+    "idx_animal_enclosure_id": "animal (enclosure_id)",
+    "idx_supplies_food_id": "supplies (food_id)",
+    "idx_employeeattributes_employee_id": "employeeAttributes (employee_id)",
+    "idx_enclosureaccess_employee_id": "enclosureAccess (employee_id)",
+    # task4: species/gender with equality, then the date of birth range from age_filters
+    "idx_animal_species_gender_dob": "animal (species, gender, date_of_birth)",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, target in INDEXES.items():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {target}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,197 @@
+"""Partition vetCard by year and add the vet card archive
+
+vetCard becomes a table range-partitioned by date with one partition per year
+(vetcard_y2024, ...) plus vetcard_default for dates outside the created years. The
+btree indexes are declared on the parent, so every partition gets its own copy and
+task2's date range only touches the partitions it overlaps.
+
+A partitioned table's primary key has to contain the partition key, so the key is
+(id, date), date becomes NOT NULL, and animal_latest_vitals references (vetcard_id, date).
+
+archive_vetcard_partitions() detaches the yearly partitions older than the kept years and
+attaches them to vetcard_archive, which is only indexed with BRIN on date. A partition
+that still holds an animal's latest vet card is referenced by animal_latest_vitals and
+stays live.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 14:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PARTITION_FUNCTIONS = """
+CREATE FUNCTION create_vetcard_partition(p_year INT)
+RETURNS VOID AS $$
+DECLARE
+    part TEXT := format('vetcard_y%s', p_year);
+    from_date DATE := make_date(p_year, 1, 1);
+    to_date DATE := make_date(p_year + 1, 1, 1);
+BEGIN
+    IF to_regclass(part) IS NOT NULL THEN
+        RETURN;
+    END IF;
+
+    -- Rows of that year may already sit in the default partition; they have to move out
+    -- before the new range can be attached
+    EXECUTE format('CREATE TABLE %I (LIKE vetCard INCLUDING DEFAULTS)', part);
+    EXECUTE format(
+        'WITH moved AS (DELETE FROM vetcard_default WHERE date >= %L AND date < %L RETURNING *) '
+        'INSERT INTO %I SELECT * FROM moved', from_date, to_date, part
+    );
+    EXECUTE format('ALTER TABLE vetCard ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)', part, from_date, to_date);
+    EXECUTE format(
+        'SELECT refresh_animal_latest_vitals(animal_id) FROM (SELECT DISTINCT animal_id FROM %I) moved', part
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION archive_vetcard_partitions(p_keep_years INT DEFAULT 5)
+RETURNS SETOF TEXT AS $$
+DECLARE
+    current_year INT := extract(year FROM current_date)::INT;
+    part RECORD;
+BEGIN
+    -- Next year's partition is created ahead so January entries never land in the default partition
+    PERFORM create_vetcard_partition(current_year + 1);
+
+    FOR part IN
+        SELECT c.relname, substring(c.relname FROM '^vetcard_y([0-9]+)$')::INT AS year
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'vetcard'::regclass
+          AND c.relname ~ '^vetcard_y[0-9]+$'
+        ORDER BY c.relname
+    LOOP
+        CONTINUE WHEN part.year > current_year - p_keep_years;
+        BEGIN
+            EXECUTE format('ALTER TABLE vetCard DETACH PARTITION %I', part.relname);
+            EXECUTE format(
+                'ALTER TABLE vetcard_archive ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                part.relname, make_date(part.year, 1, 1), make_date(part.year + 1, 1, 1)
+            );
+            RETURN NEXT part.relname;
+        EXCEPTION WHEN foreign_key_violation THEN
+            RAISE NOTICE '% still holds the latest vet card of some animals, kept live', part.relname;
+        END;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+VETCARD_TRIGGERS = """
+CREATE TRIGGER vetcard_permission_insert
+AFTER INSERT ON vetCard
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION check_veterinarian_permission_batch();
+
+CREATE TRIGGER vetcard_permission_update
+AFTER UPDATE ON vetCard
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION check_veterinarian_permission_batch();
+
+CREATE TRIGGER trg_sync_animal_latest_vitals
+AFTER INSERT OR UPDATE OR DELETE ON vetCard
+FOR EACH ROW EXECUTE FUNCTION sync_animal_latest_vitals();
+"""
+
+VETCARD_INDEXES = """
+CREATE INDEX idx_vetcard_animal_date_employee ON vetCard (animal_id, date, employee_id);
+CREATE INDEX idx_vetcard_date_employee ON vetCard (date, employee_id);
+CREATE INDEX idx_vetcard_animal_date_id ON vetCard (animal_id, date DESC, id DESC);
+CREATE INDEX idx_vetcard_employee_id ON vetCard (employee_id);
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("""
+    DO $$
+    BEGIN
+        IF EXISTS (SELECT 1 FROM vetCard WHERE date IS NULL) THEN
+            RAISE EXCEPTION 'vetCard rows without a date cannot be partitioned, set their date first';
+        END IF;
+    END;
+    $$
+    """)
+
+    op.execute("ALTER TABLE animal_latest_vitals DROP CONSTRAINT animal_latest_vitals_vetcard_id_fkey")
+    op.execute("ALTER TABLE vetCard RENAME TO vetcard_unpartitioned")
+    op.execute("ALTER TABLE vetcard_unpartitioned RENAME CONSTRAINT vetcard_pkey TO vetcard_unpartitioned_pkey")
+    op.execute("""
+    CREATE TABLE vetCard (
+        id INT NOT NULL DEFAULT nextval('vetcard_id_seq'),
+        employee_id INT CONSTRAINT vetcard_employee_id_fkey REFERENCES employee(id),
+        animal_id INT CONSTRAINT vetcard_animal_id_fkey REFERENCES animal(id),
+        current_diseases VARCHAR(100),
+        got_vaccination VARCHAR(100),
+        date DATE NOT NULL,
+        weight DECIMAL(5, 2),
+        height DECIMAL(5, 2),
+        PRIMARY KEY (id, date)
+    ) PARTITION BY RANGE (date)
+    """)
+    op.execute("CREATE TABLE vetcard_default PARTITION OF vetCard DEFAULT")
+    op.execute("CREATE TABLE vetcard_archive (LIKE vetCard) PARTITION BY RANGE (date)")
+    op.execute("CREATE INDEX idx_vetcard_archive_date_brin ON vetcard_archive USING brin (date)")
+    op.execute(PARTITION_FUNCTIONS)
+    op.execute("""
+    SELECT create_vetcard_partition(year)
+    FROM generate_series(
+        (SELECT coalesce(extract(year FROM min(date))::INT, extract(year FROM current_date)::INT) FROM vetcard_unpartitioned),
+        extract(year FROM current_date)::INT + 1
+    ) AS year
+    """)
+
+    # Triggers are created after the copy, the rows were validated when they were first written
+    op.execute("INSERT INTO vetCard SELECT * FROM vetcard_unpartitioned")
+    op.execute("ALTER SEQUENCE vetcard_id_seq OWNED BY vetCard.id")
+    op.execute("DROP TABLE vetcard_unpartitioned")
+    op.execute(VETCARD_INDEXES)
+    op.execute(VETCARD_TRIGGERS)
+    op.execute("""
+    ALTER TABLE animal_latest_vitals
+    ADD CONSTRAINT animal_latest_vitals_vetcard_fkey FOREIGN KEY (vetcard_id, date)
+    REFERENCES vetCard (id, date) ON DELETE CASCADE ON UPDATE CASCADE
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE animal_latest_vitals DROP CONSTRAINT animal_latest_vitals_vetcard_fkey")
+    op.execute("ALTER TABLE vetCard RENAME TO vetcard_partitioned")
+    op.execute("ALTER TABLE vetcard_partitioned RENAME CONSTRAINT vetcard_pkey TO vetcard_partitioned_pkey")
+    op.execute("""
+    CREATE TABLE vetCard (
+        id INT PRIMARY KEY DEFAULT nextval('vetcard_id_seq'),
+        employee_id INT CONSTRAINT vetcard_employee_id_fkey REFERENCES employee(id),
+        animal_id INT CONSTRAINT vetcard_animal_id_fkey REFERENCES animal(id),
+        current_diseases VARCHAR(100),
+        got_vaccination VARCHAR(100),
+        date DATE,
+        weight DECIMAL(5, 2),
+        height DECIMAL(5, 2)
+    )
+    """)
+    op.execute("INSERT INTO vetCard SELECT * FROM vetcard_partitioned UNION ALL SELECT * FROM vetcard_archive")
+    op.execute("ALTER SEQUENCE vetcard_id_seq OWNED BY vetCard.id")
+    op.execute("DROP TABLE vetcard_partitioned, vetcard_archive")
+    op.execute("DROP FUNCTION archive_vetcard_partitions(INT), create_vetcard_partition(INT)")
+    op.execute(VETCARD_INDEXES)
+    op.execute(VETCARD_TRIGGERS)
+    op.execute("""
+    ALTER TABLE animal_latest_vitals
+    ADD CONSTRAINT animal_latest_vitals_vetcard_id_fkey FOREIGN KEY (vetcard_id)
+    REFERENCES vetCard (id) ON DELETE CASCADE
+    """)
@@ -0,0 +1,133 @@
+"""Per-table change counters for HTTP caching
+
+table_versions holds one row per table with a counter and the time of the last change.
+A statement-level trigger on every table bumps it in the writing transaction, so the
+counter also covers bulk imports, trigger side effects and edits made outside the app.
+The feeding_schedule view and the vetCard archive change without a DML statement on the
+table itself, so refresh_feeding_schedule() and archive_vetcard_partitions() bump it
+explicitly.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 16:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = (
+    "employee", "employeeattributes", "enclosure", "enclosureaccess", "foods", "supplies",
+    "animal", "vetcard", "ration", "animalcompatibility",
+)
+
+FUNCTIONS = """
+CREATE TABLE table_versions (
+    table_name TEXT PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    changed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE FUNCTION touch_table_version(p_table TEXT)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO table_versions (table_name, version, changed_at)
+    VALUES (p_table, 1, now())
+    ON CONFLICT (table_name) DO UPDATE
+    SET version = table_versions.version + 1, changed_at = now();
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION bump_table_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM touch_table_version(TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION refresh_feeding_schedule()
+RETURNS VOID AS $$
+BEGIN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY feeding_schedule;
+    PERFORM touch_table_version('feeding_schedule');
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+ARCHIVE_FUNCTION = """
+CREATE OR REPLACE FUNCTION archive_vetcard_partitions(p_keep_years INT DEFAULT 5)
+RETURNS SETOF TEXT AS $$
+DECLARE
+    current_year INT := extract(year FROM current_date)::INT;
+    part RECORD;
+BEGIN
+    -- Next year's partition is created ahead so January entries never land in the default partition
+    PERFORM create_vetcard_partition(current_year + 1);
+
+    FOR part IN
+        SELECT c.relname, substring(c.relname FROM '^vetcard_y([0-9]+)$')::INT AS year
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'vetcard'::regclass
+          AND c.relname ~ '^vetcard_y[0-9]+$'
+        ORDER BY c.relname
+    LOOP
+        CONTINUE WHEN part.year > current_year - p_keep_years;
+        BEGIN
+            EXECUTE format('ALTER TABLE vetCard DETACH PARTITION %I', part.relname);
+            EXECUTE format(
+                'ALTER TABLE vetcard_archive ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                part.relname, make_date(part.year, 1, 1), make_date(part.year + 1, 1, 1)
+            );
+            {touch}
+            RETURN NEXT part.relname;
+        EXCEPTION WHEN foreign_key_violation THEN
+            RAISE NOTICE '% still holds the latest vet card of some animals, kept live', part.relname;
+        END;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(FUNCTIONS)
+    op.execute(ARCHIVE_FUNCTION.format(touch="PERFORM touch_table_version('vetcard');"))
+    for name in TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{name}_version AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {name} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()"
+        )
+    op.execute(
+        "INSERT INTO table_versions (table_name) SELECT unnest(ARRAY["
+        + ", ".join(f"'{name}'" for name in TABLES + ("feeding_schedule",))
+        + "])"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in TABLES:
+        op.execute(f"DROP TRIGGER trg_{name}_version ON {name}")
+    op.execute(ARCHIVE_FUNCTION.format(touch=""))
+    op.execute("""
+    CREATE OR REPLACE FUNCTION refresh_feeding_schedule()
+    RETURNS VOID AS $$
+    BEGIN
+        REFRESH MATERIALIZED VIEW CONCURRENTLY feeding_schedule;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("DROP FUNCTION bump_table_version(), touch_table_version(TEXT)")
+    op.execute("DROP TABLE table_versions")
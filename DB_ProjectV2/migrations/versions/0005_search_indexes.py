@@ -0,0 +1,56 @@
+"""Full-text and trigram indexes for /search
+
+Every searchable table gets two GIN indexes over the same text expression (its
+"document"): a 'simple' tsvector for word and word-prefix matches, and a pg_trgm
+index that serves ILIKE '%x%' substrings and misspelled names (word similarity).
+The expressions have to stay identical to SEARCH_SOURCES in main.py, otherwise the
+planner cannot use the indexes.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 18:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DOCUMENTS = {
+    "animal": "coalesce(name, '') || ' ' || coalesce(species, '')",
+    "employee": "coalesce(name, '') || ' ' || coalesce(position, '')",
+    "foods": "coalesce(name, '')",
+    "supplies": "coalesce(supplier_name, '')",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        for name, document in DOCUMENTS.items():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_{name}_search_fts "
+                f"ON {name} USING gin (to_tsvector('simple', {document}))"
+            )
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_{name}_search_trgm "
+                f"ON {name} USING gin (({document}) gin_trgm_ops)"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name in DOCUMENTS:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS idx_{name}_search_fts")
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS idx_{name}_search_trgm")
+    op.execute("DROP EXTENSION IF EXISTS pg_trgm")
@@ -0,0 +1,112 @@
+"""Indexed JSONB projection of employee attributes
+
+employee.attribute_map holds every attribute of the employee as
+{"attribute_name": ["value", ...]}, so a filter on any number of attributes is one
+containment test (attribute_map @> '{"shift": ["night"], "animals": ["large"]}')
+served by a GIN index, instead of one self-join of employeeAttributes per attribute.
+
+employeeAttributes stays the table the app writes to. Statement-level triggers rebuild
+the map of every employee touched by a statement, so bulk imports and edits made
+outside the app keep it in sync. The (attribute_name, attribute_value) index covers
+lookups on the attribute table itself.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 19:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, Sequence[str], None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+FUNCTIONS = """
+CREATE FUNCTION refresh_employee_attribute_map(p_employee_ids INT[])
+RETURNS VOID AS $$
+    UPDATE employee e
+    SET attribute_map = coalesce((
+        SELECT jsonb_object_agg(attribute_name, attribute_values)
+        FROM (
+            SELECT attribute_name, jsonb_agg(DISTINCT attribute_value ORDER BY attribute_value) AS attribute_values
+            FROM employeeAttributes a
+            WHERE a.employee_id = e.id
+            GROUP BY attribute_name
+        ) grouped
+    ), '{}')
+    WHERE e.id = ANY(p_employee_ids);
+$$ LANGUAGE sql;
+
+CREATE FUNCTION sync_employee_attribute_map()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM refresh_employee_attribute_map(ARRAY(SELECT DISTINCT employee_id FROM new_rows));
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM refresh_employee_attribute_map(ARRAY(
+            SELECT employee_id FROM new_rows UNION SELECT employee_id FROM old_rows
+        ));
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM refresh_employee_attribute_map(ARRAY(SELECT DISTINCT employee_id FROM old_rows));
+    ELSE
+        UPDATE employee SET attribute_map = '{}' WHERE attribute_map <> '{}';
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+TRIGGERS = """
+CREATE TRIGGER trg_employeeattributes_map_insert
+AFTER INSERT ON employeeAttributes
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_employee_attribute_map();
+
+CREATE TRIGGER trg_employeeattributes_map_update
+AFTER UPDATE ON employeeAttributes
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_employee_attribute_map();
+
+CREATE TRIGGER trg_employeeattributes_map_delete
+AFTER DELETE ON employeeAttributes
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_employee_attribute_map();
+
+CREATE TRIGGER trg_employeeattributes_map_truncate
+AFTER TRUNCATE ON employeeAttributes
+FOR EACH STATEMENT EXECUTE FUNCTION sync_employee_attribute_map();
+"""
+
+INDEXES = {
+    "idx_employee_attribute_map": "employee USING gin (attribute_map jsonb_path_ops)",
+    "idx_employeeattributes_name_value": "employeeAttributes (attribute_name, attribute_value) INCLUDE (employee_id)",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("ALTER TABLE employee ADD COLUMN attribute_map JSONB NOT NULL DEFAULT '{}'")
+    op.execute(FUNCTIONS)
+    op.execute(TRIGGERS)
+    op.execute("SELECT refresh_employee_attribute_map(ARRAY(SELECT DISTINCT employee_id FROM employeeAttributes))")
+    with op.get_context().autocommit_block():
+        for name, target in INDEXES.items():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {target}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    for event in ("insert", "update", "delete", "truncate"):
+        op.execute(f"DROP TRIGGER trg_employeeattributes_map_{event} ON employeeAttributes")
+    op.execute("DROP FUNCTION sync_employee_attribute_map(), refresh_employee_attribute_map(INT[])")
+    op.execute("ALTER TABLE employee DROP COLUMN attribute_map")
@@ -0,0 +1,44 @@
+"""Version columns for optimistic locking
+
+Every table with edit forms gets `version INT NOT NULL DEFAULT 1`. The app bumps it on
+each UPDATE and only writes rows whose version is still the one the client saw; the
+ORM does this through version_id_col and the batch API through its WHERE clause.
+Writes made outside the app do not bump it.
+
+vetcard_archive gets the column too: archived partitions are detached from vetCard
+and attached there, which needs identical columns.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 20:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, Sequence[str], None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = (
+    "employee", "animal", "employeeAttributes", "enclosure", "foods", "supplies",
+    "vetCard", "vetcard_archive", "ration", "animalCompatibility",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name in TABLES:
+        op.execute(f"ALTER TABLE {name} ADD COLUMN version INT NOT NULL DEFAULT 1")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in TABLES:
+        op.execute(f"ALTER TABLE {name} DROP COLUMN version")
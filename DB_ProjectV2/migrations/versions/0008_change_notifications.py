@@ -0,0 +1,113 @@
+"""Row change notifications for the realtime feed
+
+Statement-level triggers on vetCard, ration and animal send one NOTIFY per changed row
+on the zoo_changes channel: {"table", "op", "id", "animal_id", "enclosure_id",
+"previous_enclosure_id", "version"}. The payload only says what changed; clients fetch
+the row itself through the API. enclosure_id is looked up from animal so clients can
+follow a whole enclosure, and previous_enclosure_id is set when an animal moves out of one.
+
+NOTIFY is transactional, so listeners only see committed changes, in commit order.
+A statement touching more than 1000 rows (bulk imports, archiving) sends one
+{"op": "bulk", "count"} notification for the table instead, and TRUNCATE sends
+{"op": "truncate"}; clients reload what they show after either.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 21:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, Sequence[str], None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ("vetcard", "ration", "animal")
+
+FUNCTIONS = """
+CREATE FUNCTION notify_row_changes()
+RETURNS TRIGGER AS $$
+DECLARE
+    changed_rows TEXT := CASE WHEN TG_OP = 'DELETE' THEN 'old_rows' ELSE 'new_rows' END;
+    changed_count BIGINT;
+    row_keys TEXT;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        PERFORM pg_notify('zoo_changes', json_build_object('table', TG_TABLE_NAME, 'op', 'truncate')::text);
+        RETURN NULL;
+    END IF;
+
+    EXECUTE format('SELECT count(*) FROM %I', changed_rows) INTO changed_count;
+    IF changed_count > 1000 THEN
+        PERFORM pg_notify('zoo_changes', json_build_object(
+            'table', TG_TABLE_NAME, 'op', 'bulk', 'count', changed_count
+        )::text);
+        RETURN NULL;
+    END IF;
+
+    IF TG_TABLE_NAME = 'animal' AND TG_OP = 'UPDATE' THEN
+        row_keys := 'SELECT r.id, r.id AS animal_id, r.enclosure_id, '
+                    'CASE WHEN o.enclosure_id IS DISTINCT FROM r.enclosure_id THEN o.enclosure_id END AS previous_enclosure_id, '
+                    'r.version FROM %I r LEFT JOIN old_rows o ON o.id = r.id';
+    ELSIF TG_TABLE_NAME = 'animal' THEN
+        row_keys := 'SELECT r.id, r.id AS animal_id, r.enclosure_id, NULL::INT AS previous_enclosure_id, r.version FROM %I r';
+    ELSE
+        row_keys := 'SELECT r.id, r.animal_id, a.enclosure_id, NULL::INT AS previous_enclosure_id, r.version '
+                    'FROM %I r LEFT JOIN animal a ON a.id = r.animal_id';
+    END IF;
+
+    EXECUTE format(
+        'SELECT pg_notify(''zoo_changes'', json_build_object('
+        '''table'', %L, ''op'', %L, ''id'', c.id, ''animal_id'', c.animal_id, '
+        '''enclosure_id'', c.enclosure_id, ''previous_enclosure_id'', c.previous_enclosure_id, '
+        '''version'', c.version)::text) '
+        'FROM (' || row_keys || ') c ORDER BY c.id',
+        TG_TABLE_NAME, lower(TG_OP), changed_rows
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+TRIGGERS = """
+CREATE TRIGGER trg_{name}_notify_insert
+AFTER INSERT ON {name}
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION notify_row_changes();
+
+CREATE TRIGGER trg_{name}_notify_update
+AFTER UPDATE ON {name}
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION notify_row_changes();
+
+CREATE TRIGGER trg_{name}_notify_delete
+AFTER DELETE ON {name}
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION notify_row_changes();
+
+CREATE TRIGGER trg_{name}_notify_truncate
+AFTER TRUNCATE ON {name}
+FOR EACH STATEMENT EXECUTE FUNCTION notify_row_changes();
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(FUNCTIONS)
+    for name in TABLES:
+        op.execute(TRIGGERS.format(name=name))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in TABLES:
+        for event in ("insert", "update", "delete", "truncate"):
+            op.execute(f"DROP TRIGGER trg_{name}_notify_{event} ON {name}")
+    op.execute("DROP FUNCTION notify_row_changes()")
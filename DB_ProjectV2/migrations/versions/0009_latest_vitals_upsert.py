@@ -0,0 +1,78 @@
+"""Race-free refresh of animal_latest_vitals
+
+refresh_animal_latest_vitals() deleted the animal's row and inserted the latest vet card
+again. With two transactions writing vet cards for the same animal, the second one's
+DELETE waited for the first, skipped the row the first had deleted, never saw the row it
+inserted, and its INSERT failed with a duplicate key: a valid vet card write was refused.
+
+The refresh now takes a transaction-level advisory lock on the animal, so writers of the
+same animal's cards queue and each one picks the latest card after the previous one has
+committed, then upserts the row with INSERT ... ON CONFLICT. The row is deleted only when
+the animal has no vet cards left.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, Sequence[str], None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+UPSERT_REFRESH = """
+CREATE OR REPLACE FUNCTION refresh_animal_latest_vitals(p_animal_id INT)
+RETURNS VOID AS $$
+BEGIN
+    -- Held until commit; the statements below take their snapshot after a concurrent writer committed
+    PERFORM pg_advisory_xact_lock(hashtext('animal_latest_vitals'), p_animal_id);
+
+    INSERT INTO animal_latest_vitals (animal_id, vetcard_id, date, weight, height)
+    SELECT animal_id, id, date, weight, height
+    FROM vetCard
+    WHERE animal_id = p_animal_id
+    ORDER BY date DESC NULLS LAST, id DESC
+    LIMIT 1
+    ON CONFLICT (animal_id) DO UPDATE
+    SET vetcard_id = EXCLUDED.vetcard_id, date = EXCLUDED.date, weight = EXCLUDED.weight, height = EXCLUDED.height;
+
+    IF NOT FOUND THEN
+        DELETE FROM animal_latest_vitals WHERE animal_id = p_animal_id;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+DELETE_INSERT_REFRESH = """
+CREATE OR REPLACE FUNCTION refresh_animal_latest_vitals(p_animal_id INT)
+RETURNS VOID AS $$
+BEGIN
+    DELETE FROM animal_latest_vitals WHERE animal_id = p_animal_id;
+
+    INSERT INTO animal_latest_vitals (animal_id, vetcard_id, date, weight, height)
+    SELECT animal_id, id, date, weight, height
+    FROM vetCard
+    WHERE animal_id = p_animal_id
+    ORDER BY date DESC NULLS LAST, id DESC
+    LIMIT 1;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(UPSERT_REFRESH)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(DELETE_INSERT_REFRESH)
@@ -0,0 +1,143 @@
+"""Create vetCard year partitions on demand
+
+0003 created the yearly partitions from the first vet card's year to next year. A card
+dated outside them (an old record imported late, a date typed years ahead) landed in
+vetcard_default, which task2's date range then had to scan as well, and stayed there.
+
+ensure_vetcard_partitions(years) creates the missing yearly partitions, moving their rows
+out of the default partition; the app calls it before writing cards of a year it has not
+seen yet. archive_vetcard_partitions() calls it for every year left in the default
+partition, so the maintenance job empties it again.
+
+vetCard.id is only unique together with date, the partitioned primary key; ids stay unique
+because they all come from vetcard_id_seq and are never written by the app.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-19 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010'
+down_revision: Union[str, Sequence[str], None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ENSURE_PARTITIONS = """
+CREATE FUNCTION ensure_vetcard_partitions(p_years INT[])
+RETURNS SETOF TEXT AS $$
+DECLARE
+    missing INT[] := ARRAY(
+        SELECT DISTINCT year FROM unnest(p_years) AS year
+        WHERE year IS NOT NULL AND to_regclass(format('vetcard_y%s', year)) IS NULL
+        ORDER BY year
+    );
+    missing_year INT;
+BEGIN
+    IF cardinality(missing) = 0 THEN
+        RETURN;
+    END IF;
+
+    -- Two writers of a new year's first cards would both create its partition; the second one waits
+    -- here and finds it made (create_vetcard_partition skips existing partitions)
+    PERFORM pg_advisory_xact_lock(hashtext('vetcard_partitions'));
+    FOREACH missing_year IN ARRAY missing LOOP
+        IF to_regclass(format('vetcard_y%s', missing_year)) IS NULL THEN
+            PERFORM create_vetcard_partition(missing_year);
+            RETURN NEXT format('vetcard_y%s', missing_year);
+        END IF;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+ARCHIVE_FROM_DEFAULT = """
+CREATE OR REPLACE FUNCTION archive_vetcard_partitions(p_keep_years INT DEFAULT 5)
+RETURNS SETOF TEXT AS $$
+DECLARE
+    current_year INT := extract(year FROM current_date)::INT;
+    part RECORD;
+BEGIN
+    -- Next year's partition is created ahead so January entries never land in the default partition, and
+    -- any year still in the default partition (cards written before its partition existed) moves out
+    PERFORM ensure_vetcard_partitions(
+        ARRAY(SELECT DISTINCT extract(year FROM date)::INT FROM vetcard_default) || (current_year + 1)
+    );
+
+    FOR part IN
+        SELECT c.relname, substring(c.relname FROM '^vetcard_y([0-9]+)$')::INT AS year
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'vetcard'::regclass
+          AND c.relname ~ '^vetcard_y[0-9]+$'
+        ORDER BY c.relname
+    LOOP
+        CONTINUE WHEN part.year > current_year - p_keep_years;
+        BEGIN
+            EXECUTE format('ALTER TABLE vetCard DETACH PARTITION %I', part.relname);
+            EXECUTE format(
+                'ALTER TABLE vetcard_archive ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                part.relname, make_date(part.year, 1, 1), make_date(part.year + 1, 1, 1)
+            );
+            RETURN NEXT part.relname;
+        EXCEPTION WHEN foreign_key_violation THEN
+            RAISE NOTICE '% still holds the latest vet card of some animals, kept live', part.relname;
+        END;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+ARCHIVE_NEXT_YEAR = """
+CREATE OR REPLACE FUNCTION archive_vetcard_partitions(p_keep_years INT DEFAULT 5)
+RETURNS SETOF TEXT AS $$
+DECLARE
+    current_year INT := extract(year FROM current_date)::INT;
+    part RECORD;
+BEGIN
+    -- Next year's partition is created ahead so January entries never land in the default partition
+    PERFORM create_vetcard_partition(current_year + 1);
+
+    FOR part IN
+        SELECT c.relname, substring(c.relname FROM '^vetcard_y([0-9]+)$')::INT AS year
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'vetcard'::regclass
+          AND c.relname ~ '^vetcard_y[0-9]+$'
+        ORDER BY c.relname
+    LOOP
+        CONTINUE WHEN part.year > current_year - p_keep_years;
+        BEGIN
+            EXECUTE format('ALTER TABLE vetCard DETACH PARTITION %I', part.relname);
+            EXECUTE format(
+                'ALTER TABLE vetcard_archive ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                part.relname, make_date(part.year, 1, 1), make_date(part.year + 1, 1, 1)
+            );
+            RETURN NEXT part.relname;
+        EXCEPTION WHEN foreign_key_violation THEN
+            RAISE NOTICE '% still holds the latest vet card of some animals, kept live', part.relname;
+        END;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(ENSURE_PARTITIONS)
+    op.execute(ARCHIVE_FROM_DEFAULT)
+    op.execute("SELECT ensure_vetcard_partitions(ARRAY(SELECT DISTINCT extract(year FROM date)::INT FROM vetcard_default))")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(ARCHIVE_NEXT_YEAR)
+    op.execute("DROP FUNCTION ensure_vetcard_partitions(INT[])")
@@ -0,0 +1,190 @@
+"""Fixtures for the tests that run against PostgreSQL.
+
+Point ZOO_TEST_DATABASE_URL at a server the tests may create databases on, e.g.
+
+    ZOO_TEST_DATABASE_URL="postgresql+psycopg2://postgres:@/postgres?host=/tmp/pg" python -m pytest -q
+
+A scratch database is created, migrated to head with Alembic (the server needs the pg_trgm
+contrib extension for 0005) and dropped after the run. Without the variable, or when the server
+cannot be reached, the database tests are skipped.
+"""
+import json
+import os
+import sys
+from datetime import date, time, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event, insert, make_url, text
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+ADMIN_URL = os.environ.get("ZOO_TEST_DATABASE_URL")
+SCRATCH_DATABASE = f"zoo_test_{os.getpid()}"
+
+# main reads its settings on import, so the scratch database has to be configured before any test imports it
+if ADMIN_URL:
+    os.environ["ZOO_DATABASE_URL"] = make_url(ADMIN_URL).set(database=SCRATCH_DATABASE).render_as_string(hide_password=False)
+else:
+    # Engines connect lazily: the tests that need no database only need main to import
+    os.environ["ZOO_DATABASE_URL"] = "sqlite://"
+
+
+@pytest.fixture(scope="session")
+def zoo():
+    import main
+    return main
+
+
+@pytest.fixture(scope="session")
+def database(zoo):
+    """Create and migrate the scratch database once per run."""
+    if not ADMIN_URL:
+        pytest.skip("ZOO_TEST_DATABASE_URL is not set")
+
+    admin = create_engine(ADMIN_URL, isolation_level="AUTOCOMMIT")
+    try:
+        with admin.connect() as connection:
+            connection.execute(text(f'DROP DATABASE IF EXISTS "{SCRATCH_DATABASE}"'))
+            connection.execute(text(f'CREATE DATABASE "{SCRATCH_DATABASE}"'))
+    except Exception as exc:
+        admin.dispose()
+        pytest.skip(f"PostgreSQL is not available: {exc}")
+
+    from alembic import command
+    from alembic.config import Config
+
+    command.upgrade(Config(os.path.join(BASE_DIR, "alembic.ini")), "head")
+    try:
+        yield zoo
+    finally:
+        zoo.engine.dispose()
+        with admin.connect() as connection:
+            connection.execute(text(f'DROP DATABASE IF EXISTS "{SCRATCH_DATABASE}" WITH (FORCE)'))
+        admin.dispose()
+
+
+@pytest.fixture
+def db(database):
+    """A session on the scratch database; every table is emptied after the test."""
+    session = database.SessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+        empty_tables(database)
+
+
+def empty_tables(zoo):
+    tables = ", ".join(table.name for table in zoo.Base.metadata.sorted_tables)
+    with zoo.engine.begin() as connection:
+        connection.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+
+
+def add_rows(zoo, db, count):
+    """Add `count` rows to every table, each one linked to new rows of the tables it references."""
+    def add(model, rows):
+        return list(db.execute(insert(model.__table__).returning(model.__table__.c[0]), rows).scalars())
+
+    offset = db.query(zoo.Employee).count()
+    numbers = range(offset, offset + count)
+    today = date.today()
+    employees = add(zoo.Employee, [
+        {"name": f"Employee {n}", "position": "Veterinarian", "sex": "F", "age": 30 + n % 30,
+         "start_date": date(2020, 1, 1), "has_access_to_enclosures": True, "salary": 1000 + n}
+        for n in numbers
+    ])
+    enclosures = add(zoo.Enclosure, [{"size": 10 + n, "is_heated": n % 2 == 0} for n in numbers])
+    foods = add(zoo.Food, [{"type": "Vegetable", "name": f"Food {n}"} for n in numbers])
+    add(zoo.Supply, [{"food_id": food, "supplier_name": f"Supplier {n}"} for n, food in zip(numbers, foods)])
+    add(zoo.EmployeeAttribute, [
+        {"employee_id": employee, "attribute_name": "shift", "attribute_value": f"shift {n % 3}"}
+        for n, employee in zip(numbers, employees)
+    ])
+    add(zoo.EnclosureAccess, [
+        {"enclosure_id": enclosure, "employee_id": employee} for enclosure, employee in zip(enclosures, employees)
+    ])
+    parents = add(zoo.Animal, [
+        {"name": f"Parent {n}", "species": f"Species {n % 7}", "needs_heated_enclosure_for_winter": n % 2 == 0,
+         "predator_or_herbivore": "H", "gender": "M" if n % 2 else "F", "date_of_birth": date(2010, 1, 1) + timedelta(days=n),
+         "arrival_date": date(2015, 1, 1), "enclosure_id": enclosure}
+        for n, enclosure in zip(numbers, enclosures)
+    ])
+    animals = add(zoo.Animal, [
+        {"name": f"Animal {n}", "species": f"Species {n % 7}", "needs_heated_enclosure_for_winter": n % 2 == 0,
+         "predator_or_herbivore": "H", "gender": "F", "date_of_birth": date(2018, 1, 1) + timedelta(days=n),
+         "arrival_date": date(2019, 1, 1), "father_id": parents[i - 1], "mother_id": parents[i], "enclosure_id": enclosure}
+        for i, (n, enclosure) in enumerate(zip(numbers, enclosures))
+    ])
+    add(zoo.VetCard, [
+        {"employee_id": employee, "animal_id": animal, "current_diseases": "", "got_vaccination": "yes",
+         "date": today - timedelta(days=n % 300), "weight": 10 + n % 50, "height": 1 + n % 3}
+        for n, employee, animal in zip(numbers, employees, animals)
+    ])
+    add(zoo.Ration, [
+        {"day_of_the_week": "Monday", "time": time(8 + n % 10), "food_id": food, "animal_id": animal}
+        for n, food, animal in zip(numbers, foods, animals)
+    ])
+    add(zoo.AnimalCompatibility, [
+        {"first_species": f"Pair {n} a", "second_species": f"Pair {n} b", "is_compatible": n % 2 == 0} for n in numbers
+    ])
+    db.commit()
+
+
+@pytest.fixture
+def seed(database, db):
+    return lambda count: add_rows(database, db, count)
+
+
+@pytest.fixture
+def client(database, db):
+    from fastapi.testclient import TestClient
+
+    return TestClient(database.app)
+
+
+def plan_nodes(db, query):
+    """Every node of the plan PostgreSQL picks for an ORM query or Core statement."""
+    # Prefixed at the cursor, so the parameters go through the same type processing as the real query
+    def prefix(conn, cursor, statement, parameters, context, executemany):
+        return "EXPLAIN (FORMAT JSON) " + statement, parameters
+
+    connection = db.connection()
+    event.listen(connection, "before_cursor_execute", prefix, retval=True)
+    try:
+        raw = connection.execute(getattr(query, "statement", query)).scalar()
+    finally:
+        event.remove(connection, "before_cursor_execute", prefix)
+    plan = raw if isinstance(raw, list) else json.loads(raw)
+
+    nodes, pending = [], [plan[0]["Plan"]]
+    while pending:
+        node = pending.pop()
+        nodes.append(node)
+        pending.extend(node.get("Plans", []))
+    return nodes
+
+
+def explain(db, query):
+    """Index names used by the plan PostgreSQL picks for an ORM query or Core statement.
+
+    An index on a partition is reported under the partitioned index it was created from.
+    """
+    indexes = {node["Index Name"] for node in plan_nodes(db, query) if "Index Name" in node}
+    parents = dict(db.execute(text(
+        "SELECT c.relname, p.relname FROM pg_class c "
+        "JOIN pg_inherits i ON i.inhrelid = c.oid JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE c.relname = ANY(:names)"
+    ), {"names": list(indexes)}).all())
+    return {parents.get(name, name) for name in indexes}
+
+
+def scanned_tables(db, query):
+    """Names of the tables (partitions, not their parent) the plan reads."""
+    return {node["Relation Name"] for node in plan_nodes(db, query) if "Relation Name" in node}
+
+
+@pytest.fixture
+def used_indexes():
+    return explain
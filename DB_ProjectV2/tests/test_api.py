@@ -0,0 +1,35 @@
+from datetime import date
+from decimal import Decimal
+
+EMPLOYEE = {"name": "Anna", "position": "Veterinarian", "sex": "F", "age": 31, "start_date": "2024-03-01", "salary": "1234.56"}
+
+
+def test_create_employee_parses_date_and_decimal(database, client, db):
+    response = client.post("/api/v1/employees", json=EMPLOYEE)
+    assert response.status_code == 201, response.text
+    assert response.json()["start_date"] == "2024-03-01"
+
+    employee = db.get(database.Employee, response.json()["id"])
+    assert employee.start_date == date(2024, 3, 1)
+    assert employee.salary == Decimal("1234.56")
+    assert employee.has_access_to_enclosures is True
+
+
+def test_create_employee_rejects_bad_values(client):
+    assert client.post("/api/v1/employees", json={**EMPLOYEE, "start_date": "first of March"}).status_code == 422
+    assert client.post("/api/v1/employees", json={**EMPLOYEE, "salary": "a lot"}).status_code == 422
+
+
+def test_task_total_is_opt_in_and_counted_once(database, client, seed):
+    seed(25)
+    first = client.get("/api/v1/task1", params={"limit": 10}).json()
+    assert "total" not in first and len(first["items"]) == 10
+
+    misses = database.reference_cache.misses[database.COUNT_NAMESPACE]
+    assert client.get("/api/v1/task1", params={"limit": 10, "count": "true"}).json()["total"] == 25
+    second = client.get("/api/v1/task1", params={"limit": 10, "count": "true", "after": first["next_cursor"]}).json()
+    assert second["total"] == 25 and len(second["items"]) == 10
+    assert database.reference_cache.misses[database.COUNT_NAMESPACE] == misses + 1
+
+    client.post("/api/v1/employees", json=EMPLOYEE)
+    assert client.get("/api/v1/task1", params={"count": "true"}).json()["total"] == 26
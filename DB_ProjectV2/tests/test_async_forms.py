@@ -0,0 +1,69 @@
+"""The HTML form routes served on asyncpg (ZOO_ASYNC_DB=1), which takes no strings for DATE/TIME parameters."""
+import importlib.util
+import os
+import sys
+from datetime import date, time
+
+import pytest
+from sqlalchemy import insert
+
+
+@pytest.fixture(scope="module")
+def async_zoo(database):
+    """A second copy of main imported with the async engine enabled; the routes are bound on import."""
+    os.environ["ZOO_ASYNC_DB"] = "1"
+    try:
+        spec = importlib.util.spec_from_file_location("main_async", os.path.join(os.path.dirname(database.__file__), "main.py"))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["main_async"] = module
+        spec.loader.exec_module(module)
+    finally:
+        del os.environ["ZOO_ASYNC_DB"]
+    assert module.ASYNC_DB
+    yield module
+    sys.modules.pop("main_async", None)
+
+
+@pytest.fixture
+def async_client(async_zoo, db):
+    from fastapi.testclient import TestClient
+
+    with TestClient(async_zoo.app) as client:
+        yield client
+
+
+def test_form_posts_on_asyncpg(database, db, async_client):
+    enclosure_id = db.execute(insert(database.Enclosure.__table__).values(size=50, is_heated=True).returning(database.Enclosure.id)).scalar()
+    food_id = db.execute(insert(database.Food.__table__).values(type="Vegetable", name="Hay").returning(database.Food.id)).scalar()
+    db.commit()
+
+    def post(path, **form):
+        response = async_client.post(path, data=form, follow_redirects=False)
+        assert response.status_code == 303, f"{path}: {response.status_code} {response.text}"
+
+    post("/employees/create", name="Vet", position="Veterinarian", sex="F", age="40", start_date="2015-01-01", salary="1500.50")
+    employee = db.query(database.Employee).one()
+    post(f"/employees/edit/{employee.id}", name="Vet", position="Veterinarian", sex="F", age="41",
+         start_date="2016-02-03", salary="1600", version=str(employee.version))
+
+    animal_form = dict(name="Bella", species="Zebra", needs_heated_enclosure_for_winter="false", predator_or_herbivore="H",
+                       gender="F", date_of_birth="2019-05-01", arrival_date="2020-01-01", enclosure_id=str(enclosure_id))
+    post("/animals/create", **animal_form)
+    animal = db.query(database.Animal).one()
+    post(f"/animals/edit/{animal.id}", **{**animal_form, "date_of_birth": "2019-05-02", "version": str(animal.version)})
+
+    vet_card_form = dict(employee_id=str(employee.id), animal_id=str(animal.id), got_vaccination="yes", date="2024-06-01", weight="250")
+    post("/vet-cards/create", **vet_card_form)
+    vet_card = db.query(database.VetCard).one()
+    post(f"/vet-cards/edit/{vet_card.id}", **{**vet_card_form, "date": "2024-06-02", "version": str(vet_card.version)})
+
+    ration_form = dict(day_of_the_week="Monday", time="08:30", food_id=str(food_id), animal_id=str(animal.id))
+    post("/rations/create", **ration_form)
+    ration = db.query(database.Ration).one()
+    post(f"/rations/edit/{ration.id}", **{**ration_form, "time": "09:15", "version": str(ration.version)})
+
+    db.expire_all()
+    assert (employee.start_date, employee.age) == (date(2016, 2, 3), 41)
+    assert animal.date_of_birth == date(2019, 5, 2)
+    assert db.query(database.VetCard.date).scalar() == date(2024, 6, 2)
+    assert ration.time == time(9, 15)
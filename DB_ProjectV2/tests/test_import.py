@@ -0,0 +1,100 @@
+import json
+from datetime import date
+
+import pytest
+from sqlalchemy import func, insert, text
+
+MEAT_FOR_HERBIVORE = "Herbivores can only eat vegetable food"
+NOT_A_VET = "Only veterinarians can add information to vetCard table"
+
+
+@pytest.fixture
+def refs(database, db, seed):
+    """Ids to import against: a veterinarian and a cleaner, a herbivore, vegetable and meat food."""
+    seed(1)
+    refs = {
+        "vet": db.query(database.Employee.id).scalar(),
+        "animal": db.query(func.max(database.Animal.id)).scalar(),
+        "vegetable": db.query(database.Food.id).scalar(),
+        "cleaner": db.execute(insert(database.Employee.__table__).values(
+            name="Cleaner", position="Cleaner", sex="M", age=30, has_access_to_enclosures=True,
+        ).returning(database.Employee.id)).scalar(),
+        "meat": db.execute(insert(database.Food.__table__).values(type="Meat", name="Beef").returning(database.Food.id)).scalar(),
+    }
+    db.commit()
+    return refs
+
+
+def csv_upload(rows):
+    fields = list(rows[0])
+    lines = [",".join(fields)] + [",".join(str(row.get(field, "")) for field in fields) for row in rows]
+    return "rows.csv", "\n".join(lines) + "\n", "text/csv"
+
+
+def ndjson_upload(rows):
+    # A blank line is skipped but still counted, so the line numbers below are 1, 2, 4, 5
+    lines = [json.dumps(row) for row in rows]
+    return "rows.ndjson", "\n".join(lines[:2] + [""] + lines[2:]) + "\n", "application/x-ndjson"
+
+
+UPLOADS = {"csv": (csv_upload, [3, 4]), "ndjson": (ndjson_upload, [2, 4])}
+
+
+def ration_rows(refs):
+    row = {"day_of_the_week": "Monday", "time": "08:30", "food_id": refs["vegetable"], "animal_id": refs["animal"]}
+    return [row, {**row, "time": "25:99"}, {**row, "food_id": refs["meat"]}, {**row, "day_of_the_week": "Friday"}]
+
+
+def vet_card_rows(refs):
+    row = {"employee_id": refs["vet"], "animal_id": refs["animal"], "got_vaccination": "yes", "date": "2026-03-01", "weight": "12.5"}
+    return [row, {**row, "date": "first of March"}, {**row, "employee_id": refs["cleaner"]}, {**row, "weight": ""}]
+
+
+@pytest.mark.parametrize("fast", [False, True])
+@pytest.mark.parametrize("upload", UPLOADS)
+@pytest.mark.parametrize("path, table, rows, error", [
+    ("/rations/import", "ration", ration_rows, MEAT_FOR_HERBIVORE),
+    ("/vet-cards/import", "vetcard", vet_card_rows, NOT_A_VET),
+])
+def test_import_route_reports_rejected_lines(client, db, refs, path, table, rows, error, upload, fast):
+    build, lines = UPLOADS[upload]
+    before = db.execute(text(f"SELECT count(*) FROM {table}")).scalar()
+    db.rollback()
+
+    response = client.post(path, params={"fast": fast}, files={"file": build(rows(refs))})
+    assert response.status_code == 200, response.text
+    report = response.json()
+
+    assert report["inserted"] == 2
+    assert [rejected["line"] for rejected in report["rejected"]] == lines
+    assert report["rejected"][1]["error"] == error
+    assert db.execute(text(f"SELECT count(*) FROM {table}")).scalar() == before + 2
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_rows_the_database_refuses_are_retried_one_by_one(database, db, refs, fast):
+    """Without prevalidation the trigger and the foreign key reject rows; the rest of the batch still lands."""
+    row = {"day_of_the_week": "Monday", "time": "08:30", "food_id": str(refs["vegetable"]), "animal_id": str(refs["animal"])}
+    rows = enumerate([row, {**row, "food_id": str(refs["meat"])}, {**row, "animal_id": "999999"}, {**row, "time": "09:00"}], 1)
+    before = db.query(database.Ration).count()
+
+    report = database.bulk_import(db, database.Ration, database.RATION_IMPORT_FIELDS, rows, fast)
+
+    assert report["inserted"] == 2
+    assert [rejected["line"] for rejected in report["rejected"]] == [2, 3]
+    assert MEAT_FOR_HERBIVORE in report["rejected"][0]["error"]
+    assert "foreign key" in report["rejected"][1]["error"]
+    assert db.query(database.Ration).count() == before + 2
+
+
+def test_copy_rows_writes_nulls(database, db, refs):
+    rows = [
+        {"employee_id": refs["vet"], "animal_id": refs["animal"], "current_diseases": None, "got_vaccination": "yes",
+         "date": "2026-04-01", "weight": None, "height": "1.5"},
+    ]
+    database.ensure_vet_card_partitions(db, [date(2026, 4, 1)])
+    database._copy_rows(db, database.VetCard, rows)
+    db.commit()
+
+    card = db.query(database.VetCard).filter(database.VetCard.date == date(2026, 4, 1)).one()
+    assert (card.current_diseases, card.weight, str(card.height)) == (None, None, "1.50")
@@ -0,0 +1,117 @@
+"""EXPLAIN checks that the task and list route queries keep using the indexes added for them."""
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import insert, text
+
+from conftest import add_rows, empty_tables, scanned_tables
+
+ROWS = 3000
+
+
+@pytest.fixture(scope="module")
+def planned(database):
+    """A session on a database large enough, and analyzed, for the planner to prefer the indexes."""
+    zoo = database
+    session = zoo.SessionLocal()
+    add_rows(zoo, session, ROWS)
+    session.execute(text(
+        "UPDATE employee SET position = (ARRAY['Veterinarian', 'Cleaner', 'Trainer', 'Builder', 'Administrator'])[id % 5 + 1], "
+        "sex = CASE WHEN id % 2 = 0 THEN 'M' ELSE 'F' END, age = 20 + id % 45, salary = 1000 + id"
+    ))
+    session.execute(text("UPDATE animal SET species = 'Species ' || (id % 60), gender = CASE WHEN id % 2 = 0 THEN 'M' ELSE 'F' END"))
+    session.execute(insert(zoo.EmployeeAttribute.__table__), [
+        {"employee_id": employee_id, "attribute_name": "badge", "attribute_value": "gold"} for employee_id in range(1, 6)
+    ])
+    # Cards inserted around the app sit in vetcard_default until partitions are made for their years
+    session.execute(text("SELECT ensure_vetcard_partitions(ARRAY(SELECT DISTINCT extract(year FROM date)::INT FROM vetcard_default))")).all()
+    session.commit()
+    session.execute(text("ANALYZE"))
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+        empty_tables(zoo)
+
+
+def task_queries(zoo, db):
+    today = date.today()
+    return {
+        "task1 position/sex/age": (
+            zoo.task1_query(db, min_age=60, position="Trainer", sex="M"), {"idx_employee_position_sex_age"},
+        ),
+        "task1 salary": (zoo.task1_query(db, min_salary=3990), {"idx_employee_salary"}),
+        "task1 attributes": (zoo.task1_query(db, attributes={"badge": ["gold"]}), {"idx_employee_attribute_map"}),
+        "task2 animal and dates": (
+            zoo.task2_query(db, animal_id=42, start_date=today - timedelta(days=30), end_date=today),
+            {"idx_vetcard_animal_date_employee", "idx_vetcard_animal_date_id"},
+        ),
+        "task3": (zoo.task3_query(db, 42), {"enclosureaccess_pkey"}),
+        "task4 species/gender/age": (
+            zoo.task4_query(db, species="Species 7", gender="M", min_age=7), {"idx_animal_species_gender_dob"},
+        ),
+        "task4 latest vet card": (zoo.task4_query(db, species="Species 7", gender="M"), {"vetcard_pkey"}),
+        "task5": (zoo.task5_query(db, "Species 8", 2, 5), {"idx_animal_winter_species_dob"}),
+    }
+
+
+def list_queries(zoo, db):
+    """The statements behind the list pages: a keyset page by id, and each foreign key lookup."""
+    queries = {
+        f"{model.__tablename__} page": (
+            db.query(model).filter(model.id > ROWS // 2).order_by(model.id).limit(101), {f"{model.__tablename__}_pkey"},
+        )
+        for model in (zoo.Employee, zoo.EmployeeAttribute, zoo.Animal, zoo.Enclosure, zoo.Food, zoo.Supply, zoo.Ration, zoo.AnimalCompatibility)
+    }
+    queries["vetcard page"] = (
+        db.query(zoo.VetCard).filter(zoo.VetCard.id > ROWS // 2).order_by(zoo.VetCard.id).limit(101), {"vetcard_pkey"},
+    )
+    for column, *indexes in (
+        (zoo.VetCard.employee_id, "idx_vetcard_employee_id"),
+        (zoo.VetCard.animal_id, "idx_vetcard_animal_date_employee", "idx_vetcard_animal_date_id"),
+        (zoo.Ration.animal_id, "idx_ration_animal_id"),
+        (zoo.Ration.food_id, "idx_ration_food_id"),
+        (zoo.Animal.enclosure_id, "idx_animal_enclosure_id"),
+        (zoo.Animal.father_id, "idx_animal_father_id"),
+        (zoo.Animal.mother_id, "idx_animal_mother_id"),
+        (zoo.Supply.food_id, "idx_supplies_food_id"),
+        (zoo.EmployeeAttribute.employee_id, "idx_employeeattributes_employee_id"),
+        (zoo.EnclosureAccess.employee_id, "idx_enclosureaccess_employee_id"),
+    ):
+        queries[f"{column.table.name}.{column.key}"] = (db.query(column.table).filter(column == 42), set(indexes))
+    return queries
+
+
+TASKS = ("task1 position/sex/age", "task1 salary", "task1 attributes", "task2 animal and dates", "task3",
+         "task4 species/gender/age", "task4 latest vet card", "task5")
+LISTS = tuple(f"{name} page" for name in (
+    "employee", "employeeattributes", "animal", "enclosure", "foods", "supplies", "ration", "animalcompatibility", "vetcard",
+)) + (
+    "vetcard.employee_id", "vetcard.animal_id", "ration.animal_id", "ration.food_id", "animal.enclosure_id",
+    "animal.father_id", "animal.mother_id", "supplies.food_id", "employeeattributes.employee_id", "enclosureaccess.employee_id",
+)
+
+
+@pytest.mark.parametrize("name", TASKS)
+def test_task_queries_use_their_indexes(database, planned, used_indexes, name):
+    query, expected = task_queries(database, planned)[name]
+    used = used_indexes(planned, query)
+    assert used & expected, f"{name} uses {sorted(used) or 'no index'}, expected one of {sorted(expected)}"
+
+
+@pytest.mark.parametrize("name", LISTS)
+def test_list_queries_use_their_indexes(database, planned, used_indexes, name):
+    query, expected = list_queries(database, planned)[name]
+    used = used_indexes(planned, query)
+    assert used & expected, f"{name} uses {sorted(used) or 'no index'}, expected one of {sorted(expected)}"
+
+
+def test_task2_date_range_only_reads_its_partitions(database, planned):
+    year = date.today().year
+    cards = lambda query: {name for name in scanned_tables(planned, query) if name.startswith("vetcard")}
+
+    this_year = database.task2_query(planned, start_date=date(year, 1, 1), end_date=date(year, 12, 31))
+    assert cards(this_year) == {f"vetcard_y{year}"}
+    both_years = database.task2_query(planned, animal_id=42, start_date=date(year - 1, 6, 1), end_date=date(year, 1, 31))
+    assert cards(both_years) == {f"vetcard_y{year - 1}", f"vetcard_y{year}"}
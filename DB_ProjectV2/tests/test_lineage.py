@@ -0,0 +1,19 @@
+import pytest
+
+
+@pytest.mark.parametrize("path", ["pedigree", "descendants"])
+def test_unknown_animal_is_not_found(client, seed, path):
+    seed(2)
+    assert client.get(f"/animals/999999/{path}").status_code == 404
+
+
+def test_pedigree_and_descendants(database, client, db, seed):
+    seed(2)
+    child = db.query(database.Animal).filter(database.Animal.name == "Animal 1").one()
+
+    ancestors = client.get(f"/animals/{child.id}/pedigree").json()["ancestors"]
+    assert {row["id"] for row in ancestors} == {child.father_id, child.mother_id}
+    descendants = client.get(f"/animals/{child.mother_id}/descendants").json()["descendants"]
+    assert child.id in {row["id"] for row in descendants}
+    assert {row["generation"] for row in descendants} == {1}
+    assert client.get(f"/animals/{child.id}/descendants").json()["descendants"] == []
@@ -0,0 +1,108 @@
+import pytest
+from sqlalchemy import event, insert, text
+
+
+@pytest.fixture
+def foods(database, db):
+    """Three foods nothing references, so the batch may delete them; every one starts at version 1."""
+    ids = db.execute(insert(database.Food.__table__).returning(database.Food.id), [
+        {"type": "Vegetable", "name": name} for name in ("Hay", "Carrot", "Apple")
+    ]).scalars().all()
+    db.commit()
+    return ids
+
+
+def stored(db, ids):
+    db.rollback()
+    return db.execute(text("SELECT id, name, version FROM foods WHERE id = ANY(:ids) ORDER BY id"), {"ids": ids}).all()
+
+
+@pytest.fixture
+def commits(database):
+    count = []
+    listener = lambda connection: count.append(1)
+    event.listen(database.engine, "commit", listener)
+    yield count
+    event.remove(database.engine, "commit", listener)
+
+
+def test_batch_with_a_stale_version_changes_nothing(client, db, foods):
+    hay, carrot, apple = foods
+    before = stored(db, foods)
+
+    response = client.post("/api/v1/foods/batch", json={
+        "update": [{"id": hay, "version": 1, "name": "Meadow hay"}, {"id": carrot, "version": 0, "name": "Old carrot"}],
+        "delete": [{"id": apple, "version": 1}],
+    })
+
+    assert response.status_code == 409, response.text
+    assert response.json()["detail"]["conflicts"] == [carrot]
+    assert stored(db, foods) == before
+
+
+def test_batch_of_updates_and_deletes_commits_once(client, db, foods, commits):
+    hay, carrot, apple = foods
+
+    response = client.post("/api/v1/foods/batch", json={
+        "update": [{"id": hay, "version": 1, "name": "Meadow hay"}, {"id": carrot, "version": 1, "type": "Vegetable"}],
+        "delete": [{"id": apple, "version": 1}],
+    })
+
+    assert response.status_code == 200, response.text
+    assert response.json() == {"updated": [{"id": hay, "version": 2}, {"id": carrot, "version": 2}], "deleted": [apple]}
+    assert len(commits) == 1
+    assert stored(db, foods) == [(hay, "Meadow hay", 2), (carrot, "Carrot", 2)]
+
+
+def test_batch_naming_a_row_twice_is_a_conflict(client, db, foods):
+    hay, carrot, _ = foods
+    before = stored(db, foods)
+
+    # Only one of the two updates can match version 1; the same goes for an update and a delete of one row
+    twice = client.post("/api/v1/foods/batch", json={
+        "update": [{"id": hay, "version": 1, "name": "A"}, {"id": hay, "version": 1, "name": "B"}],
+    })
+    updated_and_deleted = client.post("/api/v1/foods/batch", json={
+        "update": [{"id": carrot, "version": 1, "name": "C"}], "delete": [{"id": carrot, "version": 1}],
+    })
+
+    assert (twice.status_code, twice.json()["detail"]["conflicts"]) == (409, [hay])
+    assert (updated_and_deleted.status_code, updated_and_deleted.json()["detail"]["conflicts"]) == (409, [carrot])
+    assert stored(db, foods) == before
+
+
+def test_each_write_bumps_the_version(client, db, foods):
+    hay = foods[0]
+    assert client.post("/api/v1/foods/batch", json={"update": [{"id": hay, "version": 1, "name": "A"}]}).status_code == 200
+    assert client.post(f"/foods/edit/{hay}", data={"type": "Vegetable", "name": "B", "version": 2}, follow_redirects=False).status_code == 303
+    assert stored(db, [hay]) == [(hay, "B", 3)]
+
+    # The version the first batch was sent with is gone
+    assert client.post("/api/v1/foods/batch", json={"update": [{"id": hay, "version": 1, "name": "C"}]}).status_code == 409
+
+
+def test_form_posting_an_old_version_is_refused(client, db, foods):
+    hay, carrot, _ = foods
+    form = {"type": "Vegetable", "name": "Meadow hay", "version": 1}
+    assert client.post(f"/foods/edit/{hay}", data=form, follow_redirects=False).status_code == 303
+
+    assert client.post(f"/foods/edit/{hay}", data={**form, "name": "Lost edit"}, follow_redirects=False).status_code == 409
+    assert client.post(f"/foods/delete/{hay}", data={"version": 1}, follow_redirects=False).status_code == 409
+    assert stored(db, [hay]) == [(hay, "Meadow hay", 2)]
+
+
+def test_edit_racing_another_writer_is_refused(database, client, db, foods, monkeypatch):
+    """A change committed after the form's row was loaded fails the ORM's versioned UPDATE (StaleDataError)."""
+    hay = foods[0]
+    check_version = database.check_version
+
+    def concurrent_edit(row, version):
+        check_version(row, version)
+        with database.engine.begin() as connection:
+            connection.execute(text("UPDATE foods SET name = 'Other keeper', version = version + 1 WHERE id = :id"), {"id": hay})
+
+    monkeypatch.setattr(database, "check_version", concurrent_edit)
+    response = client.post(f"/foods/edit/{hay}", data={"type": "Vegetable", "name": "Mine", "version": 1}, follow_redirects=False)
+
+    assert response.status_code == 409
+    assert stored(db, [hay]) == [(hay, "Other keeper", 2)]
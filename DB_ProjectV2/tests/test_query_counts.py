@@ -0,0 +1,24 @@
+import pytest
+
+LIST_PAGES = (
+    "/employees", "/employee-attributes", "/animals", "/enclosures", "/enclosure-access", "/foods", "/supplies",
+    "/vet-cards", "/rations", "/animal-compatibilities",
+)
+TASK_PAGES = ("/task1", "/task2", "/task3", "/task4", "/task5")
+
+
+def query_count(client, path):
+    response = client.get(path, params={"limit": 100})
+    assert response.status_code == 200, response.text
+    return int(response.headers["X-Query-Count"])
+
+
+@pytest.mark.parametrize("path", LIST_PAGES + TASK_PAGES)
+def test_query_count_does_not_grow_with_rows(database, client, seed, path):
+    counts = []
+    for added in (3, 30, 60):
+        seed(added)
+        counts.append(query_count(client, path))
+
+    assert counts == [counts[0]] * len(counts), counts
+    assert counts[0] <= database.settings.query_budget
@@ -0,0 +1,71 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def redis_backend(zoo):
+    return zoo.RedisCacheBackend(fakeredis.FakeRedis(), ttl=60)
+
+
+def test_redis_backend_round_trips_rows(zoo, redis_backend):
+    assert redis_backend.get("zoo:foods:1:all") is zoo._MISSING
+
+    rows = [{"id": 1, "name": "Hay", "date": date(2026, 1, 2), "weight": Decimal("12.50")}]
+    redis_backend.set("zoo:foods:1:all", rows)
+
+    assert redis_backend.get("zoo:foods:1:all") == [{"id": 1, "name": "Hay", "date": "2026-01-02", "weight": "12.50"}]
+    assert 0 < redis_backend.client.ttl("zoo:foods:1:all") <= 60
+
+
+def test_reference_cache_loads_once_per_version(zoo, redis_backend):
+    cache = zoo.ReferenceCache(redis_backend)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return [{"id": len(loads)}]
+
+    assert cache.get_or_load("foods", "all", loader, version=1) == [{"id": 1}]
+    assert cache.get_or_load("foods", "all", loader, version=1) == [{"id": 1}]
+    assert cache.get_or_load("foods", "all", loader, version=2) == [{"id": 2}]
+    assert (cache.hits["foods"], cache.misses["foods"]) == (1, 2)
+
+    # Without a version the key stands alone (page ETags already hash the versions)
+    assert cache.get_or_load("enclosure", "etag", loader) == [{"id": 3}]
+    assert cache.get_or_load("enclosure", "etag", loader) == [{"id": 3}]
+    assert redis_backend.get("zoo:enclosure:etag") == [{"id": 3}]
+
+
+def test_pages_read_through_the_redis_backend(database, client, seed, redis_backend, monkeypatch):
+    monkeypatch.setattr(database.reference_cache, "backend", redis_backend)
+    seed(5)
+
+    first = client.get("/foods", params={"limit": 100})
+    second = client.get("/foods", params={"limit": 100})
+    assert first.text == second.text
+    assert int(second.headers["X-Query-Count"]) < int(first.headers["X-Query-Count"])
+
+    client.post("/foods/create", data={"type": "Meat", "name": "Fresh fish"})
+    assert "Fresh fish" in client.get("/foods", params={"limit": 100}).text
+
+
+def test_html_pages_have_their_own_budget(database, client, seed, monkeypatch):
+    monkeypatch.setattr(database.settings, "cache_html", True)
+    monkeypatch.setattr(database, "page_cache", database.ReferenceCache(database.MemoryCacheBackend(max_entries=2)))
+    reference_backend = database.MemoryCacheBackend(max_entries=2)
+    monkeypatch.setattr(database.reference_cache, "backend", reference_backend)
+    seed(5)
+
+    client.get("/foods", params={"limit": 100})
+    food_keys = list(reference_backend.entries)
+    for animal_id in range(1, 6):
+        assert client.get("/task3", params={"animal_id": animal_id}).status_code == 200
+
+    assert len(database.page_cache.backend.entries) == 2
+    assert list(reference_backend.entries) == food_keys
+    assert client.get("/task3", params={"animal_id": 5}).text == client.get("/task3", params={"animal_id": 5}).text
+    assert database.page_cache.hits[database.HTTP_CACHE_NAMESPACE] >= 1
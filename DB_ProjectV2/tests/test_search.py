@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import insert, text
+
+
+@pytest.fixture
+def animals(database, db):
+    if db.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")).first() is None:
+        pytest.skip("pg_trgm is not installed")
+    enclosure_id = db.execute(insert(database.Enclosure.__table__).values(size=100, is_heated=True).returning(database.Enclosure.id)).scalar()
+
+    def add(*names):
+        db.execute(insert(database.Animal.__table__), [
+            {"name": name, "species": species, "needs_heated_enclosure_for_winter": False, "predator_or_herbivore": "P",
+             "gender": "F", "date_of_birth": "2020-01-01", "arrival_date": "2020-01-01", "enclosure_id": enclosure_id}
+            for name, species in names
+        ])
+        db.commit()
+        db.execute(text("ANALYZE animal"))
+    return add
+
+
+def search(client, q, **params):
+    response = client.get("/search", params={"q": q, **params})
+    assert response.status_code == 200, response.text
+    return [(row["kind"], row["title"]) for row in response.json()["results"]]
+
+
+def test_best_match_survives_the_candidate_cap(database, client, animals):
+    # More weak matches than SEARCH_CANDIDATES, stored ahead of the exact one
+    animals(*[(f"Lionfish {n}", "Pterois") for n in range(database.SEARCH_CANDIDATES * 3)])
+    animals(("Lion", "Panthera leo"))
+
+    assert search(client, "lion", limit=3)[0] == ("animals", "Lion")
+    assert search(client, "Lion Panthera", limit=3)[0] == ("animals", "Lion")
+
+
+def test_fuzzy_matches(client, animals):
+    animals(("Gorilla", "Gorilla gorilla"), ("Zebra", "Equus quagga"), ("Bongo", "Tragelaphus eurycerus"))
+
+    assert search(client, "Gorila")[0] == ("animals", "Gorilla")
+    assert search(client, "rill")[0] == ("animals", "Gorilla")
+    assert search(client, "zebr")[0] == ("animals", "Zebra")
+    assert ("animals", "Bongo") not in search(client, "Gorila")
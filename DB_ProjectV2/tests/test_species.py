@@ -0,0 +1,8 @@
+import pytest
+from sqlalchemy import text
+
+
+@pytest.mark.parametrize("species", ["Zebra", "  ZEBRA ", "Straße", "Lion\t"])
+def test_normalize_species_matches_the_sql_folding(zoo, database, db, species):
+    folded = db.execute(text("SELECT lower(trim(:species))"), {"species": species}).scalar()
+    assert zoo.normalize_species(species) == folded
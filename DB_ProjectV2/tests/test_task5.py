@@ -0,0 +1,92 @@
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import cast, func, insert, text
+from sqlalchemy.types import Date
+
+AGES = (None, 0, 1, 2, 3, 4)
+
+
+def fixed_today(zoo, monkeypatch, today):
+    """Freeze date.today() in main; the old filter gets the same day through age(today, date_of_birth)."""
+    class FrozenDate(date):
+        @classmethod
+        def today(cls):
+            return today
+
+    monkeypatch.setattr(zoo, "date", FrozenDate)
+
+
+def old_task5_query(zoo, db, today, species=None, min_age=None, max_age=None):
+    """The task5 filter before b8a0979: the age computed for every row."""
+    Animal = zoo.Animal
+    query = db.query(Animal).filter(Animal.needs_heated_enclosure_for_winter == True)
+    if species:
+        query = query.filter(Animal.species == species)
+
+    age = func.date_part('year', func.age(cast(today, Date), Animal.date_of_birth))
+    if min_age and min_age != 0:
+        query = query.filter(age >= min_age)
+    if max_age and max_age != 0:
+        query = query.filter(age <= max_age)
+    return query
+
+
+def add_enclosure(db, zoo):
+    return db.execute(insert(zoo.Enclosure.__table__).values(size=100, is_heated=True).returning(zoo.Enclosure.id)).scalar()
+
+
+def add_animals(db, zoo, enclosure_id, births, species="Lynx", winter=True):
+    db.execute(insert(zoo.Animal.__table__), [
+        {
+            "name": f"{species} {born}", "species": species, "needs_heated_enclosure_for_winter": winter,
+            "predator_or_herbivore": "P", "gender": "M", "date_of_birth": born, "arrival_date": born,
+            "enclosure_id": enclosure_id,
+        }
+        for born in births
+    ])
+
+
+def birthdays_around(today):
+    """Dates of birth one day either side of each whole-year birthday, plus leap days."""
+    births = set()
+    for years in range(6):
+        try:
+            birthday = today.replace(year=today.year - years)
+        except ValueError:
+            birthday = today.replace(year=today.year - years, day=28)
+        births.update(birthday + timedelta(days=shift) for shift in (-1, 0, 1))
+    births.update(date(year, 2, 29) for year in (2016, 2020, 2024) if date(year, 2, 29) <= today)
+    births.update(date(year, month, day) for year in range(today.year - 5, today.year) for month, day in ((2, 28), (3, 1)))
+    return sorted(born for born in births if born <= today)
+
+
+@pytest.mark.parametrize("today", [
+    date.today(), date(2024, 2, 28), date(2024, 2, 29), date(2024, 3, 1), date(2025, 2, 28), date(2025, 3, 1), date(2025, 12, 31),
+])
+def test_task5_matches_the_date_part_filter(zoo, db, monkeypatch, today):
+    fixed_today(zoo, monkeypatch, today)
+    enclosure_id = add_enclosure(db, zoo)
+    births = birthdays_around(today)
+    add_animals(db, zoo, enclosure_id, births)
+    add_animals(db, zoo, enclosure_id, births, species="Ibis")
+    add_animals(db, zoo, enclosure_id, births, winter=False)
+
+    for species in (None, "Lynx"):
+        for min_age in AGES:
+            for max_age in AGES:
+                new = {animal.id for animal in zoo.task5_query(db, species, min_age, max_age)}
+                old = {animal.id for animal in old_task5_query(zoo, db, today, species, min_age, max_age)}
+                assert new == old, (today, species, min_age, max_age)
+
+
+def test_task5_uses_the_partial_index(zoo, db, used_indexes):
+    enclosure_id = add_enclosure(db, zoo)
+    today = date.today()
+    births = [today - timedelta(days=day) for day in range(0, 3650, 7)]
+    for number in range(40):
+        add_animals(db, zoo, enclosure_id, births, species=f"Species {number}", winter=number % 4 == 0)
+    db.execute(text("ANALYZE animal"))
+
+    assert "idx_animal_winter_species_dob" in used_indexes(db, zoo.task5_query(db, "Species 8", 2, 5))
+    assert "idx_animal_winter_species_dob" in used_indexes(db, zoo.task5_query(db, "Species 8", 2, None))
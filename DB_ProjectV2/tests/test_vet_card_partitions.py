@@ -0,0 +1,45 @@
+from datetime import date
+
+from sqlalchemy import text
+
+
+def partition_of(db, vet_card_id):
+    return db.execute(text("SELECT tableoid::regclass::text FROM vetcard WHERE id = :id"), {"id": vet_card_id}).scalar()
+
+
+def test_writes_create_the_year_partition(database, client, db, seed):
+    seed(1)
+    employee_id, animal_id = db.execute(text("SELECT employee_id, animal_id FROM vetcard")).one()
+    # Attaching a partition waits for every open transaction that has read vetcard_default
+    db.rollback()
+    form = {"employee_id": employee_id, "animal_id": animal_id, "got_vaccination": "yes", "date": "2041-03-01"}
+    assert client.post("/vet-cards/create", data=form, follow_redirects=False).status_code == 303
+
+    vet_card_id = db.execute(text("SELECT id FROM vetcard WHERE date = '2041-03-01'")).scalar()
+    assert partition_of(db, vet_card_id) == "vetcard_y2041"
+    version = db.get(database.VetCard, vet_card_id).version
+    db.rollback()
+
+    response = client.post(f"/vet-cards/edit/{vet_card_id}", data={**form, "date": "1993-07-01", "version": version}, follow_redirects=False)
+    assert response.status_code == 303
+    assert partition_of(db, vet_card_id) == "vetcard_y1993"
+    db.rollback()
+
+    ndjson = f'{{"employee_id": {employee_id}, "animal_id": {animal_id}, "got_vaccination": "no", "date": "2042-01-05"}}\n'
+    report = client.post("/vet-cards/import", files={"file": ("cards.ndjson", ndjson, "application/x-ndjson")}).json()
+    assert report == {"inserted": 1, "rejected": []}
+    assert db.execute(text("SELECT count(*) FROM vetcard_default")).scalar() == 0
+
+
+def test_archive_moves_cards_out_of_the_default_partition(database, client, db, seed):
+    seed(1)
+    # Written around the app, as a manual fix or another client would
+    db.execute(text("INSERT INTO vetcard (employee_id, animal_id, got_vaccination, date) SELECT employee_id, animal_id, 'yes', '2047-05-05' FROM vetcard"))
+    db.commit()
+    assert db.execute(text("SELECT count(*) FROM vetcard_default")).scalar() == 1
+    db.rollback()
+
+    assert client.post("/vet-cards/archive").status_code == 200
+    assert db.execute(text("SELECT count(*) FROM vetcard_default")).scalar() == 0
+    assert db.execute(text("SELECT count(*) FROM vetcard_y2047")).scalar() == 1
+    assert db.query(database.VetCard).filter(database.VetCard.date == date(2047, 5, 5)).count() == 1
@@ -0,0 +1,62 @@
+-- Таблица с последней записью ветеринарной карты для каждого животного (используется в task4)
+CREATE TABLE IF NOT EXISTS animal_latest_vitals (
+    animal_id INT PRIMARY KEY REFERENCES animal(id) ON DELETE CASCADE,
+    vetcard_id INT NOT NULL REFERENCES vetCard(id) ON DELETE CASCADE,
+    date DATE,
+    weight DECIMAL(5, 2),
+    height DECIMAL(5, 2)
+);
+
+-- Пересчёт последней записи для одного животного. При одинаковой дате берётся запись с большим id,
+-- поэтому на животное всегда приходится ровно одна строка.
+-- Транзакции, пишущие карты одного животного, выстраиваются в очередь на advisory-блокировке: каждая
+-- выбирает последнюю запись уже после фиксации предыдущей, а строка обновляется через ON CONFLICT.
+-- Строка удаляется, только если у животного не осталось ни одной карты
+CREATE OR REPLACE FUNCTION refresh_animal_latest_vitals(p_animal_id INT)
+RETURNS VOID AS $$
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('animal_latest_vitals'), p_animal_id);
+
+    INSERT INTO animal_latest_vitals (animal_id, vetcard_id, date, weight, height)
+    SELECT animal_id, id, date, weight, height
+    FROM vetCard
+    WHERE animal_id = p_animal_id
+    ORDER BY date DESC NULLS LAST, id DESC
+    LIMIT 1
+    ON CONFLICT (animal_id) DO UPDATE
+    SET vetcard_id = EXCLUDED.vetcard_id, date = EXCLUDED.date, weight = EXCLUDED.weight, height = EXCLUDED.height;
+
+    IF NOT FOUND THEN
+        DELETE FROM animal_latest_vitals WHERE animal_id = p_animal_id;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION sync_animal_latest_vitals()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF (TG_OP IN ('INSERT', 'UPDATE') AND NEW.animal_id IS NOT NULL) THEN
+        PERFORM refresh_animal_latest_vitals(NEW.animal_id);
+    END IF;
+    IF (TG_OP IN ('UPDATE', 'DELETE') AND OLD.animal_id IS NOT NULL
+        AND (TG_OP = 'DELETE' OR OLD.animal_id IS DISTINCT FROM NEW.animal_id)) THEN
+        PERFORM refresh_animal_latest_vitals(OLD.animal_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_sync_animal_latest_vitals
+AFTER INSERT OR UPDATE OR DELETE ON vetCard
+FOR EACH ROW EXECUTE FUNCTION sync_animal_latest_vitals();
+
+-- Индекс для поиска последней записи при пересчёте
+CREATE INDEX IF NOT EXISTS idx_vetcard_animal_date_id ON vetCard (animal_id, date DESC, id DESC);
+
+-- Первоначальное заполнение из существующих ветеринарных карт
+INSERT INTO animal_latest_vitals (animal_id, vetcard_id, date, weight, height)
+SELECT DISTINCT ON (animal_id) animal_id, id, date, weight, height
+FROM vetCard
+WHERE animal_id IS NOT NULL
+ORDER BY animal_id, date DESC NULLS LAST, id DESC
+ON CONFLICT (animal_id) DO NOTHING;
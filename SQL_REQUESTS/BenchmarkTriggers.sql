@@ -0,0 +1,51 @@
+-- Сравнение скорости вставки 100 000 строк в ration с построчным (CreateTriggers.sql) и операторным
+-- (CreateStatementTriggers.sql) триггером проверки диеты. Нужны функции из обоих скриптов.
+-- Запуск: psql -d "Zoo DB" -f BenchmarkTriggers.sql
+-- Всё выполняется в одной транзакции и откатывается, поэтому данные и триггеры в базе не меняются.
+\set rows 100000
+\timing off
+BEGIN;
+
+-- Животные и корма для теста: хищник с мясом и травоядное с растительной пищей
+INSERT INTO animal (name, species, predator_or_herbivore) VALUES ('bench', 'Lion', 'P') RETURNING id AS predator_id \gset
+INSERT INTO animal (name, species, predator_or_herbivore) VALUES ('bench', 'Giraffe', 'H') RETURNING id AS herbivore_id \gset
+INSERT INTO foods (type, name) VALUES ('Meat', 'bench') RETURNING id AS meat_id \gset
+INSERT INTO foods (type, name) VALUES ('Vegetable', 'bench') RETURNING id AS vegetable_id \gset
+
+CREATE TEMP TABLE bench_rations ON COMMIT DROP AS
+SELECT
+    (ARRAY['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'])[1 + g % 7] AS day_of_the_week,
+    TIME '06:00' + (g % 12) * INTERVAL '1 hour' AS time,
+    CASE WHEN g % 2 = 0 THEN :meat_id ELSE :vegetable_id END AS food_id,
+    CASE WHEN g % 2 = 0 THEN :predator_id ELSE :herbivore_id END AS animal_id
+FROM generate_series(1, :rows) AS g;
+
+DROP TRIGGER IF EXISTS trg_check_herbivore_diet ON ration;
+DROP TRIGGER IF EXISTS trg_check_herbivore_diet_insert ON ration;
+DROP TRIGGER IF EXISTS trg_check_herbivore_diet_update ON ration;
+
+-- 1. Построчный триггер: два SELECT на каждую строку
+CREATE TRIGGER trg_check_herbivore_diet
+BEFORE INSERT OR UPDATE ON ration
+FOR EACH ROW EXECUTE FUNCTION check_herbivore_diet();
+
+\echo 'FOR EACH ROW'
+\timing on
+INSERT INTO ration (day_of_the_week, time, food_id, animal_id) SELECT * FROM bench_rations;
+\timing off
+
+DELETE FROM ration WHERE animal_id IN (:predator_id, :herbivore_id);
+DROP TRIGGER trg_check_herbivore_diet ON ration;
+
+-- 2. Операторный триггер: один JOIN по переходной таблице
+CREATE TRIGGER trg_check_herbivore_diet_insert
+AFTER INSERT ON ration
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION check_herbivore_diet_batch();
+
+\echo 'FOR EACH STATEMENT'
+\timing on
+INSERT INTO ration (day_of_the_week, time, food_id, animal_id) SELECT * FROM bench_rations;
+\timing off
+
+ROLLBACK;
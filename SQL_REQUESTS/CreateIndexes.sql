@@ -0,0 +1,22 @@
+-- Индексы для фильтров task1: должность/пол с равенством, затем диапазон по возрасту
+CREATE INDEX IF NOT EXISTS idx_employee_position_sex_age ON employee (position, sex, age);
+CREATE INDEX IF NOT EXISTS idx_employee_salary ON employee (salary);
+
+-- Индексы для task2: поиск ветеринаров по животному и диапазону дат
+CREATE INDEX IF NOT EXISTS idx_vetcard_animal_date_employee ON vetCard (animal_id, date, employee_id);
+CREATE INDEX IF NOT EXISTS idx_vetcard_date_employee ON vetCard (date, employee_id);
+
+-- Частичный индекс для task5: животные, которым нужна отапливаемая клетка зимой
+CREATE INDEX IF NOT EXISTS idx_animal_winter_species_dob ON animal (species, date_of_birth)
+WHERE needs_heated_enclosure_for_winter;
+
+-- Пара видов в animalCompatibility неупорядочена: (A, B) и (B, A) — одна и та же запись.
+-- Перед созданием индекса нужно удалить существующие дубликаты.
+CREATE UNIQUE INDEX IF NOT EXISTS uq_animalcompatibility_pair ON animalCompatibility (
+    LEAST(lower(trim(first_species)), lower(trim(second_species))),
+    GREATEST(lower(trim(first_species)), lower(trim(second_species)))
+);
+
+-- Индексы для поиска потомков по родословной
+CREATE INDEX IF NOT EXISTS idx_animal_father_id ON animal (father_id);
+CREATE INDEX IF NOT EXISTS idx_animal_mother_id ON animal (mother_id);
@@ -0,0 +1,110 @@
+-- Проверки из CreateTriggers.sql на уровне операторов. Построчные триггеры делают отдельный SELECT
+-- к foods/animal/employee для каждой строки, здесь вся вставленная или изменённая пачка проверяется
+-- одним JOIN по переходной таблице new_rows. Запускать после CreateTriggers.sql: скрипт заменяет
+-- построчные триггеры trg_check_herbivore_diet, trg_check_employee_access и vetcard_permission_trigger.
+-- trg_set_access_to_enclosures остаётся построчным, он меняет NEW и не обращается к другим таблицам.
+-- Переходные таблицы нельзя объявить для триггера на несколько событий, поэтому INSERT и UPDATE
+-- получают отдельные триггеры с общей функцией.
+
+-- Травоядным только растительная пища
+CREATE OR REPLACE FUNCTION check_herbivore_diet_batch()
+RETURNS TRIGGER AS $$
+DECLARE
+    bad_id INT;
+BEGIN
+    SELECT n.id INTO bad_id
+    FROM new_rows n
+    JOIN animal a ON a.id = n.animal_id
+    JOIN foods f ON f.id = n.food_id
+    WHERE a.predator_or_herbivore = 'H' AND f.type != 'Vegetable'
+    LIMIT 1;
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'Herbivores can only eat vegetable food'
+            USING DETAIL = format('ration id %s', bad_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_check_herbivore_diet ON ration;
+DROP TRIGGER IF EXISTS trg_check_herbivore_diet_insert ON ration;
+DROP TRIGGER IF EXISTS trg_check_herbivore_diet_update ON ration;
+
+CREATE TRIGGER trg_check_herbivore_diet_insert
+AFTER INSERT ON ration
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION check_herbivore_diet_batch();
+
+CREATE TRIGGER trg_check_herbivore_diet_update
+AFTER UPDATE ON ration
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION check_herbivore_diet_batch();
+
+-- Доступ к клеткам только у работников с has_access_to_enclosures
+CREATE OR REPLACE FUNCTION check_employee_access_batch()
+RETURNS TRIGGER AS $$
+DECLARE
+    bad_id INT;
+BEGIN
+    SELECT n.employee_id INTO bad_id
+    FROM new_rows n
+    JOIN employee e ON e.id = n.employee_id
+    WHERE e.has_access_to_enclosures = FALSE
+    LIMIT 1;
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'Employee does not have access to enclosures'
+            USING DETAIL = format('employee id %s', bad_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_check_employee_access ON enclosureAccess;
+DROP TRIGGER IF EXISTS trg_check_employee_access_insert ON enclosureAccess;
+DROP TRIGGER IF EXISTS trg_check_employee_access_update ON enclosureAccess;
+
+CREATE TRIGGER trg_check_employee_access_insert
+AFTER INSERT ON enclosureAccess
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION check_employee_access_batch();
+
+CREATE TRIGGER trg_check_employee_access_update
+AFTER UPDATE ON enclosureAccess
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION check_employee_access_batch();
+
+-- Записи в мед.карте только от ветеринаров
+CREATE OR REPLACE FUNCTION check_veterinarian_permission_batch()
+RETURNS TRIGGER AS $$
+DECLARE
+    bad_id INT;
+BEGIN
+    SELECT n.id INTO bad_id
+    FROM new_rows n
+    JOIN employee e ON e.id = n.employee_id
+    WHERE e.position != 'Veterinarian'
+    LIMIT 1;
+
+    IF FOUND THEN
+        RAISE EXCEPTION 'Only veterinarians can add information to vetCard table'
+            USING DETAIL = format('vetCard id %s', bad_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS vetcard_permission_trigger ON vetCard;
+DROP TRIGGER IF EXISTS vetcard_permission_insert ON vetCard;
+DROP TRIGGER IF EXISTS vetcard_permission_update ON vetCard;
+
+CREATE TRIGGER vetcard_permission_insert
+AFTER INSERT ON vetCard
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION check_veterinarian_permission_batch();
+
+CREATE TRIGGER vetcard_permission_update
+AFTER UPDATE ON vetCard
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION check_veterinarian_permission_batch();
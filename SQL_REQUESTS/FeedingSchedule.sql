@@ -0,0 +1,26 @@
+-- Недельный график кормления: количество порций каждого корма в каждый день и время
+CREATE MATERIALIZED VIEW IF NOT EXISTS feeding_schedule AS
+SELECT r.day_of_the_week,
+       r.time,
+       r.food_id,
+       f.name AS food_name,
+       f.type AS food_type,
+       count(*) AS portions
+FROM ration r
+JOIN foods f ON f.id = r.food_id
+GROUP BY r.day_of_the_week, r.time, r.food_id, f.name, f.type;
+
+-- Уникальный индекс нужен для REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS uq_feeding_schedule_slot_food ON feeding_schedule (day_of_the_week, time, food_id);
+CREATE INDEX IF NOT EXISTS idx_feeding_schedule_food ON feeding_schedule (food_id);
+
+-- Индекс для листа кормления на текущий день и время
+CREATE INDEX IF NOT EXISTS idx_ration_day_time ON ration (day_of_the_week, time);
+
+-- Обновление представления; приложение вызывает его после изменения рационов
+CREATE OR REPLACE FUNCTION refresh_feeding_schedule()
+RETURNS VOID AS $$
+BEGIN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY feeding_schedule;
+END;
+$$ LANGUAGE plpgsql;